@@ -22,7 +22,7 @@ _log = logging.getLogger(__name__)
 
 
 # --- Response Dataclass ---
-@dataclass
+@dataclass(slots=True)
 class Response:
     user_id: int
     username: str
@@ -39,7 +39,7 @@ class Response:
 
 
 # --- Waitlist Entry Dataclass ---
-@dataclass
+@dataclass(slots=True)
 class WaitlistEntry:
     user_id: int
     username: str
@@ -123,7 +123,12 @@ def sample_event_list():
 
 @pytest.fixture
 def prepopulated_event_cache(sample_event_list):
-    """Fixture that populates the event cache and returns the list."""
+    """Fixture that populates the event cache and returns the list.
+
+    Kept function-scoped on purpose: no file is read here (the cache is assigned
+    in memory), ``clear_caches`` resets ``EVENT_DATA_CACHE`` around every test,
+    and several tests mutate the events they are handed.
+    """
     event_data.EVENT_DATA_CACHE = sample_event_list
     # Ensure load_event_data returns this cache if called
     with patch("offkai_bot.data.event.load_event_data", return_value=sample_event_list):
@@ -618,6 +618,21 @@ def test_remove_response_found(mock_paths):
         mock_log.warning.assert_not_called()
 
 
+def test_remove_response_removes_duplicate_entries(mock_paths):
+    """Test removal drops every response for the user, e.g. duplicates in a legacy file."""
+    initial_cache = {"Event A": make_event_data([RESP_1_OBJ, RESP_2_OBJ, RESP_1_OBJ])}
+    response_data.RESPONSE_DATA_CACHE = initial_cache
+
+    with (
+        patch("offkai_bot.data.response.load_responses", return_value=initial_cache),
+        patch("offkai_bot.data.response.save_responses") as mock_save,
+    ):
+        response_data.remove_response("Event A", RESP_1_OBJ.user_id)
+
+        assert initial_cache["Event A"]["attendees"] == [RESP_2_OBJ]
+        mock_save.assert_called_once()
+
+
 def test_remove_response_not_found_user(mock_paths):
     """Test removing a response for a user who hasn't responded."""
     initial_cache = {"Event A": make_event_data([RESP_1_OBJ])}
@@ -1,6 +1,6 @@
 # tests/test_error_handler.py
 import logging
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import discord
 import pytest
@@ -19,6 +19,11 @@ from offkai_bot import (
 pytestmark = pytest.mark.asyncio
 
 
+# Shared across tests: it is only stored on errors or wrapped, never raised, so
+# nothing rebinds its traceback
+FORBIDDEN = discord.Forbidden(MagicMock(status=403, reason="Forbidden"), "Missing Permissions")
+
+
 @pytest.fixture
 def mock_interaction():
     """Creates a reusable mock discord.Interaction object for tests."""
@@ -57,10 +62,18 @@ def mock_interaction():
     return interaction
 
 
+@pytest.fixture
+def mock_log(monkeypatch):
+    """Replaces main._log with a MagicMock for the duration of a test."""
+    log = MagicMock()
+    monkeypatch.setattr(main, "_log", log)
+    return log
+
+
 # --- Test Cases ---
 
 
-async def test_on_command_error_missing_role(mock_interaction):
+async def test_on_command_error_missing_role(mock_interaction, mock_log):
     """Test handling of app_commands.MissingRole."""
     # Arrange
     # Assuming the check uses the role name/ID directly from config,
@@ -68,47 +81,43 @@ async def test_on_command_error_missing_role(mock_interaction):
     # The fixture now mocks interaction.guild.get_role.
     error = app_commands.MissingRole("Offkai Organizer")  # Role name/ID used by the check
 
-    # --- Updated Patch Target ---
-    with patch("offkai_bot.main._log") as mock_log:
-        # Act
-        await main.on_command_error(mock_interaction, error)
+    # Act
+    await main.on_command_error(mock_interaction, error)
 
-        # Assert: Check response
-        # The error handler uses the role name "Offkai Organizer" directly
-        expected_message = "❌ You need the Offkai Organizer role to use this command."
-        mock_interaction.response.send_message.assert_awaited_once_with(expected_message, ephemeral=True)
-        mock_interaction.followup.send.assert_not_called()  # Should not use followup
+    # Assert: Check response
+    # The error handler uses the role name "Offkai Organizer" directly
+    expected_message = "❌ You need the Offkai Organizer role to use this command."
+    mock_interaction.response.send_message.assert_awaited_once_with(expected_message, ephemeral=True)
+    mock_interaction.followup.send.assert_not_called()  # Should not use followup
 
-        # Assert: Check logging
-        mock_log.warning.assert_called_once()
-        log_call_args = mock_log.warning.call_args[0]
-        log_message = log_call_args[0] % log_call_args[1:]
-        assert "Missing Offkai Organizer role" in log_message  # Check specific role name
-        assert "User: TestUser#1234 (1234567890)" in log_message
-        assert "command 'mock_command'" in log_message
+    # Assert: Check logging
+    mock_log.warning.assert_called_once()
+    log_call_args = mock_log.warning.call_args[0]
+    log_message = log_call_args[0] % log_call_args[1:]
+    assert "Missing Offkai Organizer role" in log_message  # Check specific role name
+    assert "User: TestUser#1234 (1234567890)" in log_message
+    assert "command 'mock_command'" in log_message
 
 
-async def test_on_command_error_check_failure(mock_interaction):
+async def test_on_command_error_check_failure(mock_interaction, mock_log):
     """Test handling of generic app_commands.CheckFailure."""
     # Arrange
     error = app_commands.CheckFailure("Some check failed")
 
-    # --- Updated Patch Target ---
-    with patch("offkai_bot.main._log") as mock_log:
-        # Act
-        await main.on_command_error(mock_interaction, error)
+    # Act
+    await main.on_command_error(mock_interaction, error)
 
-        # Assert: Check response
-        expected_message = "❌ You do not have permission to use this command."
-        mock_interaction.response.send_message.assert_awaited_once_with(expected_message, ephemeral=True)
-        mock_interaction.followup.send.assert_not_called()
+    # Assert: Check response
+    expected_message = "❌ You do not have permission to use this command."
+    mock_interaction.response.send_message.assert_awaited_once_with(expected_message, ephemeral=True)
+    mock_interaction.followup.send.assert_not_called()
 
-        # Assert: Check logging
-        mock_log.warning.assert_called_once()
-        log_call_args = mock_log.warning.call_args[0]
-        log_message = log_call_args[0] % log_call_args[1:]
-        assert "CheckFailure for command 'mock_command'" in log_message
-        assert "User: TestUser#1234 (1234567890)" in log_message
+    # Assert: Check logging
+    mock_log.warning.assert_called_once()
+    log_call_args = mock_log.warning.call_args[0]
+    log_message = log_call_args[0] % log_call_args[1:]
+    assert "CheckFailure for command 'mock_command'" in log_message
+    assert "User: TestUser#1234 (1234567890)" in log_message
 
 
 # --- Parametrized Test for Custom BotCommandErrors ---
@@ -163,14 +172,14 @@ async def test_on_command_error_check_failure(mock_interaction):
             errors.BroadcastPermissionError,
             (
                 MagicMock(spec=discord.Thread, mention="<#123>"),
-                MagicMock(spec=discord.Forbidden),
+                FORBIDDEN,
             ),
             logging.WARNING,
             "Handled (BroadcastPermissionError)",
         ),
         (
             errors.ThreadAccessError,
-            ("EventWithPermsIssue", 555666777, MagicMock(spec=discord.Forbidden)),
+            ("EventWithPermsIssue", 555666777, FORBIDDEN),
             logging.ERROR,
             "Handled (ThreadAccessError)",
         ),
@@ -178,6 +187,7 @@ async def test_on_command_error_check_failure(mock_interaction):
 )
 async def test_on_command_error_custom_bot_error(
     mock_interaction,
+    mock_log,
     error_class,
     error_args,
     expected_log_level,
@@ -188,108 +198,100 @@ async def test_on_command_error_custom_bot_error(
     original_error = error_class(*error_args)
     error = app_commands.CommandInvokeError(mock_interaction.command, original_error)
 
-    with patch("offkai_bot.main._log") as mock_log:
-        # Act
-        await main.on_command_error(mock_interaction, error)
+    # Act
+    await main.on_command_error(mock_interaction, error)
 
-        # Assert: Check response
-        expected_message = str(original_error)
-        mock_interaction.response.send_message.assert_awaited_once_with(expected_message, ephemeral=True)
-        mock_interaction.followup.send.assert_not_called()
+    # Assert: Check response
+    expected_message = str(original_error)
+    mock_interaction.response.send_message.assert_awaited_once_with(expected_message, ephemeral=True)
+    mock_interaction.followup.send.assert_not_called()
 
-        # Assert: Check logging using _log.log()
-        mock_log.log.assert_called_once()
-        call_args, call_kwargs = mock_log.log.call_args
+    # Assert: Check logging using _log.log()
+    mock_log.log.assert_called_once()
+    call_args, call_kwargs = mock_log.log.call_args
 
-        # Assert the log level passed to _log.log()
-        assert call_args[0] == expected_log_level
+    # Assert the log level passed to _log.log()
+    assert call_args[0] == expected_log_level
 
-        # Assert the content of the log message (format string + args)
-        log_message = call_args[1] % call_args[2:]
-        assert expected_log_level_name_in_msg in log_message  # Check type name indication
-        assert f": {expected_message}" in log_message  # Check the error's message
-        assert "User: TestUser#1234 (1234567890)" in log_message
+    # Assert the content of the log message (format string + args)
+    log_message = call_args[1] % call_args[2:]
+    assert expected_log_level_name_in_msg in log_message  # Check type name indication
+    assert f": {expected_message}" in log_message  # Check the error's message
+    assert "User: TestUser#1234 (1234567890)" in log_message
 
-        # Assert specific level loggers were NOT called directly
-        mock_log.info.assert_not_called()
-        mock_log.warning.assert_not_called()
-        mock_log.error.assert_not_called()
+    # Assert specific level loggers were NOT called directly
+    mock_log.info.assert_not_called()
+    mock_log.warning.assert_not_called()
+    mock_log.error.assert_not_called()
 
 
-async def test_on_command_error_discord_forbidden(mock_interaction):
+async def test_on_command_error_discord_forbidden(mock_interaction, mock_log):
     """Test handling of discord.Forbidden (usually wrapped)."""
     # Arrange
-    mock_response = MagicMock()
-    mock_response.status = 403
-    mock_response.reason = "Forbidden"
-    original_error = discord.Forbidden(mock_response, "Missing Permissions")
-    error = app_commands.CommandInvokeError(mock_interaction.command, original_error)
+    error = app_commands.CommandInvokeError(mock_interaction.command, FORBIDDEN)
 
-    with patch("offkai_bot.main._log") as mock_log:
-        # Act
-        await main.on_command_error(mock_interaction, error)
+    # Act
+    await main.on_command_error(mock_interaction, error)
 
-        # Assert: Check response
-        expected_message = "❌ The bot lacks permissions to perform this action."
-        mock_interaction.response.send_message.assert_awaited_once_with(expected_message, ephemeral=True)
+    # Assert: Check response
+    expected_message = "❌ The bot lacks permissions to perform this action."
+    mock_interaction.response.send_message.assert_awaited_once_with(expected_message, ephemeral=True)
 
-        # Assert: Check logging (still uses direct .warning())
-        mock_log.warning.assert_called_once()
-        log_call_args = mock_log.warning.call_args[0]
-        log_message = log_call_args[0] % log_call_args[1:]
-        assert "Encountered discord.Forbidden" in log_message
-        mock_log.log.assert_not_called()  # Ensure .log() wasn't used for this case
+    # Assert: Check logging (still uses direct .warning())
+    mock_log.warning.assert_called_once()
+    log_call_args = mock_log.warning.call_args[0]
+    log_message = log_call_args[0] % log_call_args[1:]
+    assert "Encountered discord.Forbidden" in log_message
+    mock_log.log.assert_not_called()  # Ensure .log() wasn't used for this case
 
 
-async def test_on_command_error_unhandled_exception(mock_interaction):
+async def test_on_command_error_unhandled_exception(mock_interaction, mock_log):
     """Test handling of an unexpected exception."""
     # Arrange
     original_error = ValueError("Something completely unexpected happened")
     error = app_commands.CommandInvokeError(mock_interaction.command, original_error)
 
-    with patch("offkai_bot.main._log") as mock_log:
-        # Act
-        await main.on_command_error(mock_interaction, error)
+    # Act
+    await main.on_command_error(mock_interaction, error)
 
-        # Assert: Check response
-        expected_message = "❌ An unexpected error occurred. Please try again later or contact an admin."
-        mock_interaction.response.send_message.assert_awaited_once_with(expected_message, ephemeral=True)
+    # Assert: Check response
+    expected_message = "❌ An unexpected error occurred. Please try again later or contact an admin."
+    mock_interaction.response.send_message.assert_awaited_once_with(expected_message, ephemeral=True)
 
-        # Assert: Check logging (still uses direct .error())
-        mock_log.error.assert_called_once()
-        log_call_args = mock_log.error.call_args[0]
-        log_call_kwargs = mock_log.error.call_args[1]
-        log_message = log_call_args[0] % log_call_args[1:]
-        assert "Unhandled command error" in log_message
-        assert log_call_kwargs.get("exc_info") is original_error
-        mock_log.log.assert_not_called()  # Ensure .log() wasn't used for this case
+    # Assert: Check logging (still uses direct .error())
+    mock_log.error.assert_called_once()
+    log_call_args = mock_log.error.call_args[0]
+    log_call_kwargs = mock_log.error.call_args[1]
+    log_message = log_call_args[0] % log_call_args[1:]
+    assert "Unhandled command error" in log_message
+    assert log_call_kwargs.get("exc_info") is original_error
+    mock_log.log.assert_not_called()  # Ensure .log() wasn't used for this case
 
 
-async def test_on_command_error_interaction_already_done(mock_interaction):
+async def test_on_command_error_interaction_already_done(mock_interaction, mock_log):
     """Test error handling when interaction.response.is_done() is True."""
     # Arrange
     original_error = errors.EventNotFoundError("AnotherMissingEvent")  # Example using INFO level
     error = app_commands.CommandInvokeError(mock_interaction.command, original_error)
     mock_interaction.response.is_done.return_value = True
 
-    with patch("offkai_bot.main._log") as mock_log:
-        # Act
-        await main.on_command_error(mock_interaction, error)
+    # Act
+    await main.on_command_error(mock_interaction, error)
 
-        # Assert: Check response uses followup
-        expected_message = str(original_error)
-        mock_interaction.followup.send.assert_awaited_once_with(expected_message, ephemeral=True)
-        mock_interaction.response.send_message.assert_not_called()
+    # Assert: Check response uses followup
+    expected_message = str(original_error)
+    mock_interaction.followup.send.assert_awaited_once_with(expected_message, ephemeral=True)
+    mock_interaction.response.send_message.assert_not_called()
 
-        # Assert: Check logging still happens correctly using _log.log()
-        mock_log.log.assert_called_once()
-        call_args, _ = mock_log.log.call_args
-        assert call_args[0] == logging.INFO  # Check the level
-        log_message = call_args[1] % call_args[2:]
-        assert f"Handled (EventNotFoundError): {expected_message}" in log_message  # Check content
+    # Assert: Check logging still happens correctly using _log.log()
+    mock_log.log.assert_called_once()
+    call_args, _ = mock_log.log.call_args
+    assert call_args[0] == logging.INFO  # Check the level
+    log_message = call_args[1] % call_args[2:]
+    assert f"Handled (EventNotFoundError): {expected_message}" in log_message  # Check content
 
 
-async def test_on_command_error_fails_sending_response(mock_interaction):
+async def test_on_command_error_fails_sending_response(mock_interaction, mock_log):
     """Test when sending the error response itself fails."""
     # Arrange
     original_error = errors.EventNotFoundError("EventToSendFail")  # Example using INFO level
@@ -297,45 +299,43 @@ async def test_on_command_error_fails_sending_response(mock_interaction):
     send_error = discord.HTTPException(MagicMock(), "Failed to send")
     mock_interaction.response.send_message.side_effect = send_error
 
-    with patch("offkai_bot.main._log") as mock_log:
-        # Act
-        await main.on_command_error(mock_interaction, error)
+    # Act
+    await main.on_command_error(mock_interaction, error)
 
-        # Assert: Check that the original error was logged via _log.log()
-        mock_log.log.assert_called_once()
-        call_args, _ = mock_log.log.call_args
-        assert call_args[0] == logging.INFO  # Check level for handled error
-        log_message = call_args[1] % call_args[2:]
-        assert f"Handled (EventNotFoundError): {str(original_error)}" in log_message
+    # Assert: Check that the original error was logged via _log.log()
+    mock_log.log.assert_called_once()
+    call_args, _ = mock_log.log.call_args
+    assert call_args[0] == logging.INFO  # Check level for handled error
+    log_message = call_args[1] % call_args[2:]
+    assert f"Handled (EventNotFoundError): {str(original_error)}" in log_message
 
-        # Assert: Check that the failure during sending was logged (still uses direct .error())
-        mock_log.error.assert_called_once()
-        log_call_args = mock_log.error.call_args[0]
-        log_error_msg = log_call_args[0] % log_call_args[1:]
-        assert "Failed to send error response message" in log_error_msg
-        assert str(send_error) in log_error_msg
+    # Assert: Check that the failure during sending was logged (still uses direct .error())
+    mock_log.error.assert_called_once()
+    log_call_args = mock_log.error.call_args[0]
+    log_error_msg = log_call_args[0] % log_call_args[1:]
+    assert "Failed to send error response message" in log_error_msg
+    assert str(send_error) in log_error_msg
 
-        # Assert: Ensure followup wasn't attempted if response failed
-        mock_interaction.followup.send.assert_not_called()
+    # Assert: Ensure followup wasn't attempted if response failed
+    mock_interaction.followup.send.assert_not_called()
 
 
-async def test_on_command_error_no_command_context(mock_interaction):
+async def test_on_command_error_no_command_context(mock_interaction, mock_log):
     """Test error handling when interaction.command is None."""
     # Arrange
     mock_interaction.command = None  # Explicitly set command to None
     error = app_commands.CheckFailure("Check failed without command context")
 
-    with patch("offkai_bot.main._log") as mock_log:
-        # Act
-        await main.on_command_error(mock_interaction, error)
+    # Act
+    await main.on_command_error(mock_interaction, error)
 
-        # Assert: Check response is still sent
-        expected_message = "❌ You do not have permission to use this command."
-        mock_interaction.response.send_message.assert_awaited_once_with(expected_message, ephemeral=True)
+    # Assert: Check response is still sent
+    expected_message = "❌ You do not have permission to use this command."
+    mock_interaction.response.send_message.assert_awaited_once_with(expected_message, ephemeral=True)
 
-        # Assert: Check logging uses "Unknown"
-        mock_log.warning.assert_called_once()
-        log_call_args = mock_log.warning.call_args[0]
-        log_message = log_call_args[0] % log_call_args[1:]
-        assert "CheckFailure for command 'Unknown'" in log_message  # Verify fallback name
-        assert "User: TestUser#1234 (1234567890)" in log_message
+    # Assert: Check logging uses "Unknown"
+    mock_log.warning.assert_called_once()
+    log_call_args = mock_log.warning.call_args[0]
+    log_message = log_call_args[0] % log_call_args[1:]
+    assert "CheckFailure for command 'Unknown'" in log_message  # Verify fallback name
+    assert "User: TestUser#1234 (1234567890)" in log_message
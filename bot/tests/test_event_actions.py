@@ -1,5 +1,9 @@
 import logging
-from unittest.mock import AsyncMock, MagicMock, patch
+import re
+from dataclasses import replace
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, patch, sentinel
 
 import discord
 import pytest
@@ -18,223 +22,223 @@ from offkai_bot.errors import (
 from offkai_bot.event_actions import perform_close_event, send_event_message
 
 # pytest marker for async tests
-pytestmark = pytest.mark.asyncio
-
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Format string perform_close_event logs when the closing message can't be delivered.
+CLOSE_MSG_FAILED_FMT = "Could not send closing message for event '%s': %s"
+# Expected rendering of CLOSE_MSG_FAILED_FMT for each fetch_thread_for_event error.
+CLOSE_MSG_FAILED_RES = {
+    MissingChannelIDError: re.compile(
+        r"^Could not send closing message for event 'Summer Bash': .*does not have a channel ID"
+    ),
+    ThreadNotFoundError: re.compile(
+        r"^Could not send closing message for event 'Summer Bash': .*Could not find thread channel"
+    ),
+    ThreadAccessError: re.compile(r"^Could not send closing message for event 'Summer Bash': Bot lacks permissions"),
+}
 
 # --- Fixtures ---
 
 
+@pytest.fixture(scope="module")
+def patched_event_actions():
+    """Patches event_actions' collaborators once for the whole module."""
+    with patch.multiple(
+        "offkai_bot.event_actions",
+        _log=DEFAULT,
+        save_event_data=DEFAULT,
+        save_responses=DEFAULT,
+        create_event_message=DEFAULT,
+        set_event_open_status=DEFAULT,
+        assign_attendee_numbers=DEFAULT,
+        OpenEvent=DEFAULT,
+        ClosedEvent=DEFAULT,
+        PostDeadlineEvent=DEFAULT,
+        update_event_message=DEFAULT,  # async targets are patched with AsyncMocks
+        fetch_thread_for_event=DEFAULT,
+    ) as created:
+        yield SimpleNamespace(**created)
+
+
+@pytest.fixture
+def mocks(patched_event_actions):
+    """Hands the shared module patches to a test and resets them afterwards."""
+    yield patched_event_actions
+    for mock in vars(patched_event_actions).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
 def mock_client():
-    """Fixture to create a mock discord.Client."""
-    client = MagicMock(spec=discord.Client)
-    return client
+    """Fixture for an opaque client; the patched collaborators only pass it along."""
+    return sentinel.client
 
 
 @pytest.fixture
 def mock_thread():
-    """Fixture for a mock discord.Thread with a send method."""
-    thread = MagicMock(spec=discord.Thread)
-    thread.id = 111222333
-    thread.send = AsyncMock()
-    return thread
+    """Fixture for a stand-in thread; event_actions only uses its id, mention and send."""
+    return SimpleNamespace(id=111222333, mention="<#111222333>", send=AsyncMock())
 
 
 @pytest.fixture
-def mock_event():
-    """Fixture for a generic mock Event object."""
-    return MagicMock(spec=Event)
+def unposted_event():
+    """Fixture for an open Event without a deadline whose message hasn't been sent yet."""
+    return Event(
+        event_name="Test Event",
+        venue="Test Venue",
+        address="1 Test St",
+        google_maps_link="g",
+        event_datetime=datetime(3024, 8, 1, 19, 0, tzinfo=UTC),
+        open=True,
+    )
 
 
 @pytest.fixture
 def mock_closed_event(sample_event_list):
     """
     Fixture providing an Event object representing the state *after* closing.
-    Based on 'Summer Bash' from sample_event_list.
+    Based on 'Summer Bash' from sample_event_list. Function-scoped because
+    perform_close_event writes max_attendee_number onto the event it closes.
     """
-    original_event = next((e for e in sample_event_list if e.event_name == "Summer Bash"), None)
-    if original_event is None:
-        pytest.fail("Could not find 'Summer Bash' in sample_event_list fixture")
+    events_by_name = {e.event_name: e for e in sample_event_list}
+    return replace(events_by_name["Summer Bash"], open=False)
 
-    closed_event = Event(**original_event.__dict__)
-    closed_event.open = False
-    return closed_event
+
+@pytest.fixture
+def closing_mocks(mocks, mock_closed_event, mock_thread):
+    """Wires the shared mocks for a close of 'Summer Bash' that reaches its thread."""
+    mocks.set_event_open_status.return_value = mock_closed_event
+    mocks.fetch_thread_for_event.return_value = mock_thread
+    mock_thread.id = mock_closed_event.thread_id
 
 
 # --- Tests for send_event_message ---
 
 
-@patch("offkai_bot.event_actions.save_event_data")
-@patch("offkai_bot.event_actions.create_event_message")
-@patch("offkai_bot.event_actions.get_event_view")
-@patch("offkai_bot.event_actions._log")
 async def test_send_event_message_sends_and_pins_for_open_event(
-    mock_log,
-    mock_get_event_view,
-    mock_create_message,
-    mock_save_data,
+    mocks,
     mock_thread,
-    mock_event,
+    unposted_event,
 ):
     """Verify that send_event_message sends, pins, and saves for an OPEN event."""
     # Arrange
     message_content = "Test message for an open event"
-    mock_create_message.return_value = message_content
-    mock_message = AsyncMock(spec=discord.Message)
+    mocks.create_event_message.return_value = message_content
+    mock_message = AsyncMock()
     mock_message.id = 998877
     mock_thread.send.return_value = mock_message
-    mock_event.open = True
-    mock_event.event_name = "Test Open Event"
+    unposted_event.event_name = "Test Open Event"
 
     # Act
-    await send_event_message(mock_thread, mock_event)
+    await send_event_message(mock_thread, unposted_event)
 
     # Assert
-    mock_get_event_view.assert_called_once_with(mock_event)
-    mock_thread.send.assert_awaited_once_with(message_content, view=mock_get_event_view.return_value)
+    mocks.OpenEvent.assert_called_once_with(unposted_event)
+    mocks.PostDeadlineEvent.assert_not_called()
+    mock_thread.send.assert_awaited_once_with(message_content, view=mocks.OpenEvent.return_value)
     mock_message.pin.assert_awaited_once_with(reason="New event message.")
-    assert mock_event.message_id == mock_message.id
-    mock_save_data.assert_called_once()
-    mock_log.info.assert_called_once()
+    assert unposted_event.message_id == mock_message.id
+    mocks.save_event_data.assert_called_once()
+    mocks._log.info.assert_called_once()
 
 
-@patch("offkai_bot.event_actions.save_event_data")
-@patch("offkai_bot.event_actions.create_event_message")
-@patch("offkai_bot.event_actions.ClosedEvent")
-@patch("offkai_bot.event_actions.OpenEvent")
-@patch("offkai_bot.event_actions._log")
 async def test_send_event_message_sends_and_pins_for_closed_event(
-    mock_log,
-    mock_open_event_view,
-    mock_closed_event_view,
-    mock_create_message,
-    mock_save_data,
+    mocks,
     mock_thread,
-    mock_event,
+    unposted_event,
 ):
     """Verify that send_event_message sends, pins, and saves for a CLOSED event."""
     # Arrange
     message_content = "Test message for a closed event"
-    mock_create_message.return_value = message_content
-    mock_message = AsyncMock(spec=discord.Message)
+    mocks.create_event_message.return_value = message_content
+    mock_message = AsyncMock()
     mock_message.id = 776655
     mock_thread.send.return_value = mock_message
-    mock_event.open = False
-    mock_event.event_name = "Test Closed Event"
+    unposted_event.open = False
+    unposted_event.event_name = "Test Closed Event"
 
     # Act
-    await send_event_message(mock_thread, mock_event)
+    await send_event_message(mock_thread, unposted_event)
 
     # Assert
-    mock_closed_event_view.assert_called_once_with(mock_event)
-    mock_open_event_view.assert_not_called()
-    mock_thread.send.assert_awaited_once_with(message_content, view=mock_closed_event_view.return_value)
+    mocks.ClosedEvent.assert_called_once_with(unposted_event)
+    mocks.OpenEvent.assert_not_called()
+    mock_thread.send.assert_awaited_once_with(message_content, view=mocks.ClosedEvent.return_value)
     mock_message.pin.assert_awaited_once_with(reason="New event message.")
-    assert mock_event.message_id == mock_message.id
-    mock_save_data.assert_called_once()
-    mock_log.info.assert_called_once()
+    assert unposted_event.message_id == mock_message.id
+    mocks.save_event_data.assert_called_once()
+    mocks._log.info.assert_called_once()
 
 
-@patch("offkai_bot.event_actions.save_event_data")
-@patch("offkai_bot.event_actions.create_event_message")
-@patch("offkai_bot.event_actions.OpenEvent")
-@patch("offkai_bot.event_actions._log")
 async def test_send_event_message_http_error_on_send(
-    mock_log,
-    mock_open_event_view,
-    mock_create_message,
-    mock_save_data,
+    mocks,
     mock_thread,
-    mock_event,
+    unposted_event,
 ):
     """Verify pinning and saving do not occur if channel.send fails with HTTPException."""
     # Arrange
-    mock_create_message.return_value = "This message will fail to send"
+    mocks.create_event_message.return_value = "This message will fail to send"
     http_error = discord.HTTPException(MagicMock(), "Test send failure")
     mock_thread.send.side_effect = http_error
-    mock_event.open = True
-    mock_event.event_name = "Test Failing Event"
-    mock_event.message_id = None
+    unposted_event.event_name = "Test Failing Event"
 
     # Act
-    await send_event_message(mock_thread, mock_event)
+    await send_event_message(mock_thread, unposted_event)
 
     # Assert
     mock_thread.send.assert_awaited_once()
-    assert mock_event.message_id is None
-    mock_save_data.assert_not_called()
-    mock_log.error.assert_called_once()
+    assert unposted_event.message_id is None
+    mocks.save_event_data.assert_not_called()
+    mocks._log.error.assert_called_once()
     # This assertion is now corrected to match the updated log message
-    assert "Failed to send or pin event message" in mock_log.error.call_args[0][0]
-    mock_log.info.assert_not_called()
+    assert "Failed to send or pin event message" in mocks._log.error.call_args[0][0]
+    mocks._log.info.assert_not_called()
 
 
-@patch("offkai_bot.event_actions.save_event_data")
-@patch("offkai_bot.event_actions.create_event_message")
-@patch("offkai_bot.event_actions.OpenEvent")
-@patch("offkai_bot.event_actions._log")
 async def test_send_event_message_raises_on_pin_failure(
-    mock_log,
-    mock_open_event_view,
-    mock_create_message,
-    mock_save_data,
+    mocks,
     mock_thread,
-    mock_event,
+    unposted_event,
 ):
     """Verify PinPermissionError is raised if pinning fails, but message is still saved."""
     # Arrange
-    mock_create_message.return_value = "Test message"
-    mock_message = AsyncMock(spec=discord.Message)
+    mocks.create_event_message.return_value = "Test message"
+    mock_message = AsyncMock()
     mock_message.id = 12345
     forbidden_error = discord.Forbidden(MagicMock(), "Missing Permissions to Pin")
-    mock_message.pin.side_effect = forbidden_error
+    mock_message.pin = AsyncMock(side_effect=forbidden_error)
     mock_thread.send.return_value = mock_message
-    mock_event.open = True
-    mock_event.event_name = "Test Pin Fail Event"
+    unposted_event.event_name = "Test Pin Fail Event"
 
     # Act & Assert
     with pytest.raises(PinPermissionError) as exc_info:
-        await send_event_message(mock_thread, mock_event)
+        await send_event_message(mock_thread, unposted_event)
 
     assert exc_info.value.channel is mock_thread
     assert exc_info.value.original_exception is forbidden_error
     mock_thread.send.assert_awaited_once()
     mock_message.pin.assert_awaited_once()
-    assert mock_event.message_id == mock_message.id
-    mock_save_data.assert_called_once()
-    mock_log.info.assert_called_once()
-    mock_log.error.assert_not_called()
+    assert unposted_event.message_id == mock_message.id
+    mocks.save_event_data.assert_called_once()
+    mocks._log.info.assert_called_once()
+    mocks._log.error.assert_not_called()
 
 
 # --- Tests for perform_close_event ---
 
 
-@patch("offkai_bot.event_actions.fetch_thread_for_event", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.update_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.save_event_data")
-@patch("offkai_bot.event_actions.assign_attendee_numbers")
-@patch("offkai_bot.event_actions.set_event_open_status")
-@patch("offkai_bot.event_actions._log")
+@pytest.mark.usefixtures("closing_mocks")
 async def test_perform_close_event_success_with_message(
-    mock_log,
-    mock_set_status,
-    mock_assign_attendee_numbers,
-    mock_save_data,
-    mock_update_msg_view,
-    mock_fetch_thread,
+    mocks,
     mock_client,
     mock_thread,
     mock_closed_event,
-    prepopulated_event_cache,
 ):
     """Test the successful path of perform_close_event with a closing message."""
     # Arrange
     event_name_to_close = "Summer Bash"
     close_text = "Responses are now closed!"
-    mock_set_status.return_value = mock_closed_event
-    mock_assign_attendee_numbers.return_value = 42
-    mock_fetch_thread.return_value = mock_thread
-    mock_thread.id = mock_closed_event.thread_id
+    mocks.assign_attendee_numbers.return_value = 42
     mock_thread.mention = f"<#{mock_thread.id}>"
 
     # Act
@@ -246,40 +250,35 @@ async def test_perform_close_event_success_with_message(
 
     # Assert
     assert result == mock_closed_event
-    mock_set_status.assert_called_once_with(event_name_to_close, target_open_status=False)
-    mock_assign_attendee_numbers.assert_called_once_with(event_name_to_close)
+    mocks.set_event_open_status.assert_called_once_with(event_name_to_close, target_open_status=False)
+    mocks.assign_attendee_numbers.assert_called_once_with(event_name_to_close)
     assert mock_closed_event.max_attendee_number == 42
-    mock_save_data.assert_called_once()
-    mock_update_msg_view.assert_awaited_once_with(mock_client, mock_closed_event)
-    mock_fetch_thread.assert_awaited_once_with(mock_client, mock_closed_event)
+    mocks.save_event_data.assert_called_once()
+    mocks.update_event_message.assert_awaited_once_with(mock_client, mock_closed_event)
+    mocks.fetch_thread_for_event.assert_awaited_once_with(mock_client, mock_closed_event)
     mock_thread.send.assert_awaited_once_with(f"**Responses Closed:**\n{close_text}")
-    mock_log.warning.assert_not_called()
-    mock_log.error.assert_not_called()
-
-
-@patch("offkai_bot.event_actions.fetch_thread_for_event", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.update_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.save_event_data")
-@patch("offkai_bot.event_actions.assign_attendee_numbers")
-@patch("offkai_bot.event_actions.set_event_open_status")
-@patch("offkai_bot.event_actions._log")
+    # Snapshot the info calls once and compare the whole set
+    assert {c.args for c in mocks._log.info.call_args_list} == {
+        ("Attempting to close event '%s'...", event_name_to_close),
+        ("Event '%s' status set to closed and data saved.", event_name_to_close),
+        ("Updated persistent message for event '%s'.", event_name_to_close),
+        ("Sent closing message to thread %s for event '%s'.", mock_thread.id, event_name_to_close),
+    }
+    mocks._log.warning.assert_not_called()
+    mocks._log.error.assert_not_called()
+
+
+@pytest.mark.usefixtures("closing_mocks")
 async def test_perform_close_event_success_no_message(
-    mock_log,
-    mock_set_status,
-    mock_assign_attendee_numbers,
-    mock_save_data,
-    mock_update_msg_view,
-    mock_fetch_thread,
+    mocks,
     mock_client,
     mock_thread,
     mock_closed_event,
-    prepopulated_event_cache,
 ):
     """Test the successful path of perform_close_event without a closing message."""
     # Arrange
     event_name_to_close = "Summer Bash"
-    mock_set_status.return_value = mock_closed_event
-    mock_assign_attendee_numbers.return_value = 42
+    mocks.assign_attendee_numbers.return_value = 42
 
     # Act
     result = await perform_close_event(
@@ -290,12 +289,12 @@ async def test_perform_close_event_success_no_message(
 
     # Assert
     assert result == mock_closed_event
-    mock_set_status.assert_called_once_with(event_name_to_close, target_open_status=False)
-    mock_assign_attendee_numbers.assert_called_once_with(event_name_to_close)
+    mocks.set_event_open_status.assert_called_once_with(event_name_to_close, target_open_status=False)
+    mocks.assign_attendee_numbers.assert_called_once_with(event_name_to_close)
     assert mock_closed_event.max_attendee_number == 42
-    mock_save_data.assert_called_once()
-    mock_update_msg_view.assert_awaited_once_with(mock_client, mock_closed_event)
-    mock_fetch_thread.assert_not_awaited()
+    mocks.save_event_data.assert_called_once()
+    mocks.update_event_message.assert_awaited_once_with(mock_client, mock_closed_event)
+    mocks.fetch_thread_for_event.assert_not_awaited()
     mock_thread.send.assert_not_awaited()
 
 
@@ -307,26 +306,16 @@ async def test_perform_close_event_success_no_message(
         (EventAlreadyClosedError, ("Autumn Meetup",)),
     ],
 )
-@patch("offkai_bot.event_actions.fetch_thread_for_event", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.update_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.save_event_data")
-@patch("offkai_bot.event_actions.set_event_open_status")
-@patch("offkai_bot.event_actions._log")
 async def test_perform_close_event_set_status_errors(
-    mock_log,
-    mock_set_status,
-    mock_save_data,
-    mock_update_msg_view,
-    mock_fetch_thread,
+    mocks,
     mock_client,
     error_type,
     error_args,
-    prepopulated_event_cache,
 ):
     """Test that errors from set_event_open_status are propagated."""
     # Arrange
     event_name = error_args[0]
-    mock_set_status.side_effect = error_type(*error_args)
+    mocks.set_event_open_status.side_effect = error_type(*error_args)
 
     # Act & Assert
     with pytest.raises(error_type):
@@ -336,33 +325,23 @@ async def test_perform_close_event_set_status_errors(
             close_msg="Attempting to close",
         )
 
-    mock_set_status.assert_called_once_with(event_name, target_open_status=False)
-    mock_save_data.assert_not_called()
-    mock_update_msg_view.assert_not_awaited()
-    mock_fetch_thread.assert_not_awaited()
+    mocks.set_event_open_status.assert_called_once_with(event_name, target_open_status=False)
+    mocks.save_event_data.assert_not_called()
+    mocks.update_event_message.assert_not_called()
+    mocks.fetch_thread_for_event.assert_not_called()
 
 
-@patch("offkai_bot.event_actions.fetch_thread_for_event", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.update_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.save_event_data")
-@patch("offkai_bot.event_actions.set_event_open_status")
-@patch("offkai_bot.event_actions._log")
+@pytest.mark.usefixtures("closing_mocks")
 async def test_perform_close_event_update_message_error(
-    mock_log,
-    mock_set_status,
-    mock_save_data,
-    mock_update_msg_view,
-    mock_fetch_thread,
+    mocks,
     mock_client,
     mock_closed_event,
-    prepopulated_event_cache,
 ):
     """Test that errors from update_event_message are propagated."""
     # Arrange
     event_name_to_close = "Summer Bash"
-    mock_set_status.return_value = mock_closed_event
     update_error = discord.HTTPException(MagicMock(), "Failed to update message")
-    mock_update_msg_view.side_effect = update_error
+    mocks.update_event_message.side_effect = update_error
 
     # Act & Assert
     with pytest.raises(discord.HTTPException, match="Failed to update message"):
@@ -372,46 +351,35 @@ async def test_perform_close_event_update_message_error(
             close_msg="Closing",
         )
 
-    mock_set_status.assert_called_once_with(event_name_to_close, target_open_status=False)
-    mock_save_data.assert_called_once()
-    mock_update_msg_view.assert_awaited_once_with(mock_client, mock_closed_event)
-    mock_fetch_thread.assert_not_awaited()
+    mocks.set_event_open_status.assert_called_once_with(event_name_to_close, target_open_status=False)
+    mocks.save_event_data.assert_called_once()
+    mocks.update_event_message.assert_awaited_once_with(mock_client, mock_closed_event)
+    mocks.fetch_thread_for_event.assert_not_awaited()
 
 
+@pytest.mark.usefixtures("closing_mocks")
 @pytest.mark.parametrize(
-    "error_type, error_args, expected_log_level, expected_log_fragment",
+    "error_type, error_args, expected_log_level",
     [
-        (MissingChannelIDError, ("Summer Bash",), logging.WARNING, "does not have a channel ID"),
-        (ThreadNotFoundError, ("Summer Bash", 12345), logging.WARNING, "Could not find thread channel"),
-        (ThreadAccessError, ("Summer Bash", 12345), logging.ERROR, "Bot lacks permissions"),
+        (MissingChannelIDError, ("Summer Bash",), logging.WARNING),
+        (ThreadNotFoundError, ("Summer Bash", 12345), logging.WARNING),
+        (ThreadAccessError, ("Summer Bash", 12345), logging.ERROR),
     ],
 )
-@patch("offkai_bot.event_actions.fetch_thread_for_event", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.update_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.save_event_data")
-@patch("offkai_bot.event_actions.set_event_open_status")
-@patch("offkai_bot.event_actions._log")
 async def test_perform_close_event_fetch_thread_errors_handled(
-    mock_log,
-    mock_set_status,
-    mock_save_data,
-    mock_update_msg_view,
-    mock_fetch_thread,
+    mocks,
     mock_client,
     mock_thread,
     mock_closed_event,
-    prepopulated_event_cache,
     error_type,
     error_args,
     expected_log_level,
-    expected_log_fragment,
 ):
     """Test that errors during fetch_thread_for_event are caught and logged."""
     # Arrange
     event_name_to_close = error_args[0]
     close_text = "Closing!"
-    mock_set_status.return_value = mock_closed_event
-    mock_fetch_thread.side_effect = error_type(*error_args)
+    mocks.fetch_thread_for_event.side_effect = error_type(*error_args)
 
     # Act
     result = await perform_close_event(
@@ -422,47 +390,33 @@ async def test_perform_close_event_fetch_thread_errors_handled(
 
     # Assert
     assert result == mock_closed_event
-    mock_set_status.assert_called_once()
-    mock_save_data.assert_called_once()
-    mock_update_msg_view.assert_awaited_once()
-    mock_fetch_thread.assert_awaited_once_with(mock_client, mock_closed_event)
+    mocks.set_event_open_status.assert_called_once()
+    mocks.save_event_data.assert_called_once()
+    mocks.update_event_message.assert_awaited_once()
+    mocks.fetch_thread_for_event.assert_awaited_once_with(mock_client, mock_closed_event)
     mock_thread.send.assert_not_awaited()
 
-    mock_log.log.assert_called_once()
-    args, kwargs = mock_log.log.call_args
+    mocks._log.log.assert_called_once()
+    args, kwargs = mocks._log.log.call_args
     assert args[0] == expected_log_level
-    assert "Could not send closing message for event" in args[1]
+    assert args[1] == CLOSE_MSG_FAILED_FMT
     # With lazy %s-style logging, the event name and error are passed as separate args
-    assert event_name_to_close in args[2:]
-    formatted_msg = args[1] % args[2:]
-    assert expected_log_fragment in formatted_msg
+    assert CLOSE_MSG_FAILED_RES[error_type].search(args[1] % args[2:])
 
 
-@patch("offkai_bot.event_actions.fetch_thread_for_event", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.update_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.save_event_data")
-@patch("offkai_bot.event_actions.set_event_open_status")
-@patch("offkai_bot.event_actions._log")
+@pytest.mark.usefixtures("closing_mocks")
 async def test_perform_close_event_send_close_msg_fails_handled(
-    mock_log,
-    mock_set_status,
-    mock_save_data,
-    mock_update_msg_view,
-    mock_fetch_thread,
+    mocks,
     mock_client,
     mock_thread,
     mock_closed_event,
-    prepopulated_event_cache,
 ):
     """Test that errors during thread.send are caught and logged."""
     # Arrange
     event_name_to_close = "Summer Bash"
     close_text = "Closing!"
-    mock_set_status.return_value = mock_closed_event
-    mock_fetch_thread.return_value = mock_thread
     send_error = discord.HTTPException(MagicMock(), "Cannot send messages")
     mock_thread.send.side_effect = send_error
-    mock_thread.id = mock_closed_event.thread_id
 
     # Act
     result = await perform_close_event(
@@ -473,13 +427,13 @@ async def test_perform_close_event_send_close_msg_fails_handled(
 
     # Assert
     assert result == mock_closed_event
-    mock_set_status.assert_called_once()
-    mock_save_data.assert_called_once()
-    mock_update_msg_view.assert_awaited_once()
-    mock_fetch_thread.assert_awaited_once_with(mock_client, mock_closed_event)
+    mocks.set_event_open_status.assert_called_once()
+    mocks.save_event_data.assert_called_once()
+    mocks.update_event_message.assert_awaited_once()
+    mocks.fetch_thread_for_event.assert_awaited_once_with(mock_client, mock_closed_event)
     mock_thread.send.assert_awaited_once_with(f"**Responses Closed:**\n{close_text}")
-    mock_log.warning.assert_called_once()
-    args = mock_log.warning.call_args[0]
+    mocks._log.warning.assert_called_once()
+    args = mocks._log.warning.call_args[0]
     assert "Could not send closing message to thread" in args[0]
     # With lazy %s-style logging, thread id and error are passed as separate args
     formatted_msg = args[0] % args[1:]
@@ -487,31 +441,19 @@ async def test_perform_close_event_send_close_msg_fails_handled(
     assert str(send_error) in formatted_msg
 
 
-@patch("offkai_bot.event_actions.fetch_thread_for_event", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.update_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.save_event_data")
-@patch("offkai_bot.event_actions.set_event_open_status")
-@patch("offkai_bot.event_actions._log")
+@pytest.mark.usefixtures("closing_mocks")
 async def test_perform_close_event_unexpected_send_error_handled(
-    mock_log,
-    mock_set_status,
-    mock_save_data,
-    mock_update_msg_view,
-    mock_fetch_thread,
+    mocks,
     mock_client,
     mock_thread,
     mock_closed_event,
-    prepopulated_event_cache,
 ):
     """Test that unexpected errors during thread.send are caught and logged."""
     # Arrange
     event_name_to_close = "Summer Bash"
     close_text = "Closing!"
-    mock_set_status.return_value = mock_closed_event
-    mock_fetch_thread.return_value = mock_thread
     send_error = ValueError("Something unexpected broke")
     mock_thread.send.side_effect = send_error
-    mock_thread.id = mock_closed_event.thread_id
 
     # Act
     result = await perform_close_event(
@@ -522,13 +464,13 @@ async def test_perform_close_event_unexpected_send_error_handled(
 
     # Assert
     assert result == mock_closed_event
-    mock_set_status.assert_called_once()
-    mock_save_data.assert_called_once()
-    mock_update_msg_view.assert_awaited_once()
-    mock_fetch_thread.assert_awaited_once_with(mock_client, mock_closed_event)
+    mocks.set_event_open_status.assert_called_once()
+    mocks.save_event_data.assert_called_once()
+    mocks.update_event_message.assert_awaited_once()
+    mocks.fetch_thread_for_event.assert_awaited_once_with(mock_client, mock_closed_event)
     mock_thread.send.assert_awaited_once_with(f"**Responses Closed:**\n{close_text}")
-    mock_log.exception.assert_called_once()
-    args = mock_log.exception.call_args[0]
+    mocks._log.exception.assert_called_once()
+    args = mocks._log.exception.call_args[0]
     assert "Unexpected error sending closing message for event" in args[0]
     # With lazy %s-style logging, event name is passed as a separate arg
     formatted_msg = args[0] % args[1:]
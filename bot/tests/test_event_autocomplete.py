@@ -1,43 +1,70 @@
 # tests/test_main_autocomplete.py
 
+from dataclasses import replace
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch, sentinel
 
-import discord
 import pytest
-from discord.ext import commands
 
 # Import the module containing the autocomplete functions
 from offkai_bot.cogs.events import EventsCog
 
 # Import the Event dataclass to create test data
 from offkai_bot.data.event import Event
+from offkai_bot.data.response import WaitlistEntry
+from offkai_bot.errors import EventNotFoundError
 
 # pytest marker for async tests
-pytestmark = pytest.mark.asyncio
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Fixed timestamp for the sample data; the autocompletes never compare against it
+SAMPLE_DATETIME = datetime(2024, 1, 1, 19, 0)
+
+# Names sample_events yields for each open_status filter when 'current' is empty
+ALL_NON_ARCHIVED = frozenset({"Summer Party", "Winter Gathering", "Spring Fling", "Autumn Festival", "Summer BBQ"})
+OPEN_ONLY = frozenset({"Summer Party", "Spring Fling", "Summer BBQ"})
+CLOSED_ONLY = frozenset({"Winter Gathering", "Autumn Festival"})
 
 # --- Test Data Fixtures ---
 
 
 @pytest.fixture
 def mock_interaction():
-    """Fixture to create a basic mock discord.Interaction."""
-    interaction = MagicMock(spec=discord.Interaction)
-    return interaction
+    """Fixture for a stand-in interaction; the autocompletes only read its namespace."""
+    return SimpleNamespace(namespace=SimpleNamespace(event_name=""))
 
 
 @pytest.fixture
-def mock_cog():
-    """Fixture to create a mock EventsCog instance."""
-    bot = MagicMock(spec=commands.Bot)
-    return EventsCog(bot)
+def mock_load_data(monkeypatch):
+    """Replaces load_event_data where the cog uses it."""
+    load = MagicMock()
+    monkeypatch.setattr("offkai_bot.cogs.events.load_event_data", load)
+    return load
 
 
 @pytest.fixture
+def mock_get_waitlist(monkeypatch):
+    """Replaces get_waitlist where the cog uses it."""
+    get_waitlist = MagicMock()
+    monkeypatch.setattr("offkai_bot.cogs.events.get_waitlist", get_waitlist)
+    return get_waitlist
+
+
+@pytest.fixture(scope="module")
+def mock_cog():
+    """Fixture to create an EventsCog instance around a placeholder bot."""
+    return EventsCog(sentinel.bot)
+
+
+@pytest.fixture(scope="module")
 def sample_events():
-    """Fixture providing a list of sample Event objects for testing."""
-    now = datetime.now()
-    return [
+    """Fixture providing sample Event objects for testing.
+
+    Module-scoped since the autocomplete only reads the events; a tuple keeps
+    an accidental in-place edit from leaking into later tests.
+    """
+    return (
         Event(
             event_name="Summer Party",
             venue="Beach",
@@ -45,7 +72,7 @@ def sample_events():
             google_maps_link="g1",
             open=True,
             archived=False,
-            event_datetime=now,
+            event_datetime=SAMPLE_DATETIME,
         ),
         Event(
             event_name="Winter Gathering",
@@ -54,7 +81,7 @@ def sample_events():
             google_maps_link="g2",
             open=False,
             archived=False,
-            event_datetime=now,
+            event_datetime=SAMPLE_DATETIME,
         ),
         Event(
             event_name="Spring Fling",
@@ -63,7 +90,7 @@ def sample_events():
             google_maps_link="g3",
             open=True,
             archived=False,
-            event_datetime=now,
+            event_datetime=SAMPLE_DATETIME,
         ),
         Event(
             event_name="Autumn Festival",
@@ -72,7 +99,7 @@ def sample_events():
             google_maps_link="g4",
             open=False,
             archived=False,
-            event_datetime=now,
+            event_datetime=SAMPLE_DATETIME,
         ),
         Event(
             event_name="Archived Event",
@@ -81,7 +108,7 @@ def sample_events():
             google_maps_link="g5",
             open=False,
             archived=True,
-            event_datetime=now,
+            event_datetime=SAMPLE_DATETIME,
         ),  # Archived
         Event(
             event_name="Summer BBQ",
@@ -90,15 +117,21 @@ def sample_events():
             google_maps_link="g6",
             open=True,
             archived=False,
-            event_datetime=now,
+            event_datetime=SAMPLE_DATETIME,
         ),  # Another open one
-    ]
+    )
+
+
+@pytest.fixture(scope="module")
+def many_open_events(sample_events):
+    """Fixture providing 30 matching open events, more than Discord's 25-choice limit."""
+    prototype = sample_events[0]  # "Summer Party": open, not archived
+    return tuple(replace(prototype, event_name=f"Event {i}") for i in range(30))
 
 
 # --- Tests for event_autocomplete_base ---
 
 
-@patch("offkai_bot.cogs.events.load_event_data")  # Patch where load_event_data is USED
 async def test_autocomplete_base_no_events(mock_load_data, mock_interaction, mock_cog):
     """Test autocomplete when no events are loaded."""
     mock_load_data.return_value = []
@@ -107,112 +140,41 @@ async def test_autocomplete_base_no_events(mock_load_data, mock_interaction, moc
     mock_load_data.assert_called_once()
 
 
-@patch("offkai_bot.cogs.events.load_event_data")
-async def test_autocomplete_base_no_current_all_open_status(mock_load_data, mock_interaction, sample_events, mock_cog):
-    """Test autocomplete with empty 'current' and no open_status filter."""
-    mock_load_data.return_value = sample_events
-    choices = await EventsCog.event_autocomplete_base(mock_cog, mock_interaction, current="", open_status=None)
-    # Should return all non-archived events
-    expected_names = {"Summer Party", "Winter Gathering", "Spring Fling", "Autumn Festival", "Summer BBQ"}
-    returned_names = {choice.value for choice in choices}
-    assert len(choices) == 5
-    assert returned_names == expected_names
-
-
-@patch("offkai_bot.cogs.events.load_event_data")
-async def test_autocomplete_base_no_current_open_only(mock_load_data, mock_interaction, sample_events, mock_cog):
-    """Test autocomplete with empty 'current' filtering for open=True."""
-    mock_load_data.return_value = sample_events
-    choices = await EventsCog.event_autocomplete_base(mock_cog, mock_interaction, current="", open_status=True)
-    # Should return only open, non-archived events
-    expected_names = {"Summer Party", "Spring Fling", "Summer BBQ"}
-    returned_names = {choice.value for choice in choices}
-    assert len(choices) == 3
-    assert returned_names == expected_names
-
-
-@patch("offkai_bot.cogs.events.load_event_data")
-async def test_autocomplete_base_no_current_closed_only(mock_load_data, mock_interaction, sample_events, mock_cog):
-    """Test autocomplete with empty 'current' filtering for open=False."""
-    mock_load_data.return_value = sample_events
-    choices = await EventsCog.event_autocomplete_base(mock_cog, mock_interaction, current="", open_status=False)
-    # Should return only closed, non-archived events
-    expected_names = {"Winter Gathering", "Autumn Festival"}
-    returned_names = {choice.value for choice in choices}
-    assert len(choices) == 2
-    assert returned_names == expected_names
-
-
-@patch("offkai_bot.cogs.events.load_event_data")
-async def test_autocomplete_base_partial_match_case_insensitive(
-    mock_load_data, mock_interaction, sample_events, mock_cog
-):
-    """Test autocomplete with partial, case-insensitive 'current' string."""
-    mock_load_data.return_value = sample_events
-    choices = await EventsCog.event_autocomplete_base(mock_cog, mock_interaction, current="sum", open_status=None)
-    # Should match "Summer Party" and "Summer BBQ"
-    expected_names = {"Summer Party", "Summer BBQ"}
-    returned_names = {choice.value for choice in choices}
-    assert len(choices) == 2
-    assert returned_names == expected_names
-
-
-@patch("offkai_bot.cogs.events.load_event_data")
-async def test_autocomplete_base_partial_match_with_open_filter(
-    mock_load_data, mock_interaction, sample_events, mock_cog
+@pytest.mark.parametrize(
+    "current, open_status, expected_names",
+    [
+        # Empty 'current': every non-archived event, optionally filtered by open status
+        ("", None, ALL_NON_ARCHIVED),
+        ("", True, OPEN_ONLY),
+        ("", False, CLOSED_ONLY),
+        # Partial, case-insensitive matches
+        ("sum", None, frozenset({"Summer Party", "Summer BBQ"})),
+        ("fest", False, frozenset({"Autumn Festival"})),
+        # No match
+        ("xyz", None, frozenset()),
+        # Archived events are always excluded
+        ("Archived", None, frozenset()),
+        ("Archived", True, frozenset()),
+        ("Archived", False, frozenset()),
+    ],
+)
+async def test_autocomplete_base_filters(
+    mock_load_data, mock_interaction, sample_events, mock_cog, current, open_status, expected_names
 ):
-    """Test autocomplete with partial 'current' and open=False filter."""
+    """Test autocomplete filtering by 'current' substring and open_status."""
     mock_load_data.return_value = sample_events
-    choices = await EventsCog.event_autocomplete_base(mock_cog, mock_interaction, current="fest", open_status=False)
-    # Should match "Autumn Festival" (which is closed)
-    expected_names = {"Autumn Festival"}
-    returned_names = {choice.value for choice in choices}
-    assert len(choices) == 1
-    assert returned_names == expected_names
-
-
-@patch("offkai_bot.cogs.events.load_event_data")
-async def test_autocomplete_base_no_match(mock_load_data, mock_interaction, sample_events, mock_cog):
-    """Test autocomplete when 'current' matches no events."""
-    mock_load_data.return_value = sample_events
-    choices = await EventsCog.event_autocomplete_base(mock_cog, mock_interaction, current="xyz", open_status=None)
-    assert choices == []
-
-
-@patch("offkai_bot.cogs.events.load_event_data")
-async def test_autocomplete_base_archived_excluded(mock_load_data, mock_interaction, sample_events, mock_cog):
-    """Test that archived events are always excluded."""
-    mock_load_data.return_value = sample_events
-    # Try matching the archived event name
-    choices = await EventsCog.event_autocomplete_base(mock_cog, mock_interaction, current="Archived", open_status=None)
-    assert choices == []
-    choices_open = await EventsCog.event_autocomplete_base(
-        mock_cog, mock_interaction, current="Archived", open_status=True
+    choices = await EventsCog.event_autocomplete_base(
+        mock_cog, mock_interaction, current=current, open_status=open_status
     )
-    assert choices_open == []
-    choices_closed = await EventsCog.event_autocomplete_base(
-        mock_cog, mock_interaction, current="Archived", open_status=False
-    )
-    assert choices_closed == []
+    returned_names = [choice.value for choice in choices]
+    # Length check first so a duplicate choice can't hide behind the set comparison
+    assert len(returned_names) == len(expected_names)
+    assert set(returned_names) == expected_names
 
 
-@patch("offkai_bot.cogs.events.load_event_data")
-async def test_autocomplete_base_limit_choices(mock_load_data, mock_interaction, mock_cog):
+async def test_autocomplete_base_limit_choices(mock_load_data, mock_interaction, mock_cog, many_open_events):
     """Test that the number of choices is limited to 25."""
-    # Create 30 matching events
-    events = [
-        Event(
-            event_name=f"Event {i}",
-            venue="V",
-            address="A",
-            google_maps_link="G",
-            open=True,
-            archived=False,
-            event_datetime=datetime.now(),
-        )
-        for i in range(30)
-    ]
-    mock_load_data.return_value = events
+    mock_load_data.return_value = many_open_events
     choices = await EventsCog.event_autocomplete_base(mock_cog, mock_interaction, current="Event", open_status=None)
     assert len(choices) == 25  # Discord limit
 
@@ -220,36 +182,24 @@ async def test_autocomplete_base_limit_choices(mock_load_data, mock_interaction,
 # --- Tests for Wrapper Autocomplete Functions ---
 
 
-@patch(
-    "offkai_bot.cogs.events.EventsCog.event_autocomplete_base", new_callable=AsyncMock
-)  # Mock the method on the class
-async def test_offkai_autocomplete_active(mock_base_autocomplete, mock_interaction, mock_cog):
-    """Test that offkai_autocomplete_active calls base with open_status=True."""
-    current_str = "test"
-    await EventsCog.offkai_autocomplete_active(mock_cog, mock_interaction, current_str)
-    # The mock is on the class, so it intercepts calls.
-    # Invocation via mock_cog (instance) or Class should trigger it.
-    # Arg 'self' (mock_cog) is passed as first arg to the mock if called via Class with explicit instance?
-    # Actually, if we mock EventsCog.event_autocomplete_base,
-    # calling EventsCog.func(mock_cog) -> calls mock_base(mock_cog, ...)
-    mock_base_autocomplete.assert_awaited_once_with(mock_interaction, current_str, open_status=True)
-
-
-@patch("offkai_bot.cogs.events.EventsCog.event_autocomplete_base", new_callable=AsyncMock)
-async def test_offkai_autocomplete_closed_only(mock_base_autocomplete, mock_interaction, mock_cog):
-    """Test that offkai_autocomplete_closed_only calls base with open_status=False."""
-    current_str = "closed"
-    await EventsCog.offkai_autocomplete_closed_only(mock_cog, mock_interaction, current_str)
-    mock_base_autocomplete.assert_awaited_once_with(mock_interaction, current_str, open_status=False)
-
-
+@pytest.mark.parametrize(
+    "wrapper, expected_open_status",
+    [
+        (EventsCog.offkai_autocomplete_active, True),
+        (EventsCog.offkai_autocomplete_closed_only, False),
+        (EventsCog.offkai_autocomplete_all_non_archived, None),
+    ],
+)
+# Mock the method on the class; calling the wrapper with mock_cog as self
+# dispatches through it without passing self on
 @patch("offkai_bot.cogs.events.EventsCog.event_autocomplete_base", new_callable=AsyncMock)
-async def test_offkai_autocomplete_all_non_archived(mock_base_autocomplete, mock_interaction, mock_cog):
-    """Test that offkai_autocomplete_all_non_archived calls base with open_status=None."""
-    current_str = "any"
-    await EventsCog.offkai_autocomplete_all_non_archived(mock_cog, mock_interaction, current_str)
-    # Currently calls with open_status=None, same as _active
-    mock_base_autocomplete.assert_awaited_once_with(mock_interaction, current_str, open_status=None)
+async def test_autocomplete_wrappers_pass_open_status(
+    mock_base_autocomplete, mock_interaction, mock_cog, wrapper, expected_open_status
+):
+    """Test that each wrapper autocomplete calls the base with its open_status filter."""
+    current_str = "test"
+    await wrapper(mock_cog, mock_interaction, current_str)
+    mock_base_autocomplete.assert_awaited_once_with(mock_interaction, current_str, open_status=expected_open_status)
 
 
 async def test_promote_event_autocomplete_includes_all_non_archived_events():
@@ -261,13 +211,10 @@ async def test_promote_event_autocomplete_includes_all_non_archived_events():
 # --- Tests for waitlist_user_autocomplete ---
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_waitlist_entries():
-    """Fixture providing sample WaitlistEntry objects."""
-    from offkai_bot.data.response import WaitlistEntry
-
-    now = datetime.now()
-    return [
+    """Fixture providing sample WaitlistEntry objects, shared read-only across the module."""
+    return (
         WaitlistEntry(
             user_id=1001,
             username="alice",
@@ -275,7 +222,7 @@ def sample_waitlist_entries():
             behavior_confirmed=True,
             arrival_confirmed=True,
             event_name="Summer Party",
-            timestamp=now,
+            timestamp=SAMPLE_DATETIME,
             display_name="Alice W",
         ),
         WaitlistEntry(
@@ -285,7 +232,7 @@ def sample_waitlist_entries():
             behavior_confirmed=True,
             arrival_confirmed=True,
             event_name="Summer Party",
-            timestamp=now,
+            timestamp=SAMPLE_DATETIME,
             display_name="Bob M",
         ),
         WaitlistEntry(
@@ -295,16 +242,14 @@ def sample_waitlist_entries():
             behavior_confirmed=True,
             arrival_confirmed=True,
             event_name="Summer Party",
-            timestamp=now,
+            timestamp=SAMPLE_DATETIME,
             display_name=None,
         ),
-    ]
+    )
 
 
-@patch("offkai_bot.cogs.events.get_waitlist")
 async def test_waitlist_autocomplete_empty_event_name(mock_get_waitlist, mock_interaction, mock_cog):
     """Test that empty event_name returns empty list."""
-    mock_interaction.namespace = MagicMock()
     mock_interaction.namespace.event_name = ""
 
     choices = await EventsCog.waitlist_user_autocomplete(mock_cog, mock_interaction, "")
@@ -312,22 +257,19 @@ async def test_waitlist_autocomplete_empty_event_name(mock_get_waitlist, mock_in
     mock_get_waitlist.assert_not_called()
 
 
-@patch("offkai_bot.cogs.events.get_waitlist")
 async def test_waitlist_autocomplete_missing_event_name(mock_get_waitlist, mock_interaction, mock_cog):
     """Test that missing event_name attribute returns empty list."""
-    mock_interaction.namespace = MagicMock(spec=[])  # No attributes
+    mock_interaction.namespace = object()  # No attributes
 
     choices = await EventsCog.waitlist_user_autocomplete(mock_cog, mock_interaction, "")
     assert choices == []
     mock_get_waitlist.assert_not_called()
 
 
-@patch("offkai_bot.cogs.events.get_waitlist")
 async def test_waitlist_autocomplete_returns_matching_choices(
     mock_get_waitlist, mock_interaction, mock_cog, sample_waitlist_entries
 ):
     """Test that waitlisted users are returned as choices."""
-    mock_interaction.namespace = MagicMock()
     mock_interaction.namespace.event_name = "Summer Party"
     mock_get_waitlist.return_value = sample_waitlist_entries
 
@@ -342,12 +284,10 @@ async def test_waitlist_autocomplete_returns_matching_choices(
     assert choices[2].value == "1003"
 
 
-@patch("offkai_bot.cogs.events.get_waitlist")
 async def test_waitlist_autocomplete_partial_filter(
     mock_get_waitlist, mock_interaction, mock_cog, sample_waitlist_entries
 ):
     """Test that partial filter matches correctly."""
-    mock_interaction.namespace = MagicMock()
     mock_interaction.namespace.event_name = "Summer Party"
     mock_get_waitlist.return_value = sample_waitlist_entries
 
@@ -356,12 +296,8 @@ async def test_waitlist_autocomplete_partial_filter(
     assert choices[0].value == "1001"
 
 
-@patch("offkai_bot.cogs.events.get_waitlist")
 async def test_waitlist_autocomplete_event_not_found(mock_get_waitlist, mock_interaction, mock_cog):
     """Test that exception from get_waitlist returns empty list."""
-    from offkai_bot.errors import EventNotFoundError
-
-    mock_interaction.namespace = MagicMock()
     mock_interaction.namespace.event_name = "NonExistent"
     mock_get_waitlist.side_effect = EventNotFoundError("NonExistent")
 
@@ -1,5 +1,6 @@
 import logging
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, patch
 
 import discord
 import pytest
@@ -41,38 +42,90 @@ def mock_message():
 
 # Use events from conftest sample_event_list where possible
 @pytest.fixture
-def mock_event_open(sample_event_list):
+def events_by_name(sample_event_list):
+    """Indexes the conftest sample events by name."""
+    return {e.event_name: e for e in sample_event_list}
+
+
+@pytest.fixture
+def mock_event_open(events_by_name):
     """An open, non-archived event with IDs."""
-    return next(e for e in sample_event_list if e.event_name == "Summer Bash")
+    return events_by_name["Summer Bash"]
 
 
 @pytest.fixture
-def mock_event_closed(sample_event_list):
+def mock_event_closed(events_by_name):
     """A closed, non-archived event with IDs."""
-    return next(e for e in sample_event_list if e.event_name == "Autumn Meetup")
+    return events_by_name["Autumn Meetup"]
 
 
 @pytest.fixture
-def mock_event_archived(sample_event_list):
+def mock_event_archived(events_by_name):
     """An archived event."""
-    return next(e for e in sample_event_list if e.event_name == "Archived Party")
+    return events_by_name["Archived Party"]
 
 
 @pytest.fixture
-def mock_event_no_ids(sample_event_list):
+def mock_event_no_ids(events_by_name):
     """An event missing channel/message IDs."""
-    event = next(e for e in sample_event_list if e.event_name == "Summer Bash")
-    event_copy = Event(**event.__dict__)
+    event_copy = Event(**events_by_name["Summer Bash"].__dict__)
     event_copy.channel_id = None
     event_copy.thread_id = None
     event_copy.message_id = None
     return event_copy
 
 
+@pytest.fixture
+def mock_log():
+    """Patches the event_actions logger."""
+    with patch("offkai_bot.event_actions._log") as log:
+        yield log
+
+
+@pytest.fixture
+def send_mocks():
+    """Patches what send_event_message calls out to."""
+    with patch.multiple(
+        "offkai_bot.event_actions",
+        _log=DEFAULT,
+        create_event_message=DEFAULT,
+        save_event_data=DEFAULT,
+    ) as created:
+        yield SimpleNamespace(**created)
+
+
+@pytest.fixture
+def update_mocks():
+    """Patches what update_event_message calls out to; async helpers become AsyncMocks."""
+    with patch.multiple(
+        "offkai_bot.event_actions",
+        _log=DEFAULT,
+        create_event_message=DEFAULT,
+        fetch_thread_for_event=DEFAULT,
+        _fetch_event_message=DEFAULT,
+        send_event_message=DEFAULT,
+    ) as created:
+        yield SimpleNamespace(**created)
+
+
+@pytest.fixture
+def main_mocks():
+    """Patches what load_and_update_events calls out to in offkai_bot.main."""
+    with patch.multiple(
+        "offkai_bot.main",
+        _log=DEFAULT,
+        load_event_data=DEFAULT,
+        update_event_message=DEFAULT,
+        fetch_thread_for_event=DEFAULT,
+        register_deadline_reminders=DEFAULT,
+        register_checkin_reminder=DEFAULT,
+    ) as created:
+        yield SimpleNamespace(**created)
+
+
 # --- Tests for fetch_thread_for_event ---
 
 
-@patch("offkai_bot.event_actions._log")
 async def test_fetch_thread_success_get_channel(mock_log, mock_client, mock_thread, mock_event_open):
     """Test fetch_thread_for_event success using client.get_channel."""
     mock_client.get_channel.return_value = mock_thread
@@ -86,7 +139,6 @@ async def test_fetch_thread_success_get_channel(mock_log, mock_client, mock_thre
     mock_log.error.assert_not_called()
 
 
-@patch("offkai_bot.event_actions._log")
 async def test_fetch_thread_success_fetch_channel(mock_log, mock_client, mock_thread, mock_event_open):
     """Test fetch_thread_for_event success using client.fetch_channel fallback."""
     mock_client.get_channel.return_value = None  # Simulate cache miss
@@ -101,7 +153,6 @@ async def test_fetch_thread_success_fetch_channel(mock_log, mock_client, mock_th
     mock_log.debug.assert_called_once()  # Check debug log for fallback
 
 
-@patch("offkai_bot.event_actions._log")
 async def test_fetch_thread_missing_id(mock_log, mock_client, mock_event_no_ids):
     """Test fetch_thread_for_event raises MissingChannelIDError."""
     with pytest.raises(MissingChannelIDError) as exc_info:
@@ -112,7 +163,6 @@ async def test_fetch_thread_missing_id(mock_log, mock_client, mock_event_no_ids)
     mock_client.fetch_channel.assert_not_awaited()
 
 
-@patch("offkai_bot.event_actions._log")
 async def test_fetch_thread_not_found_fetch(mock_log, mock_client, mock_event_open):
     """Test fetch_thread_for_event raises ThreadNotFoundError on fetch_channel NotFound."""
     mock_client.get_channel.return_value = None
@@ -127,7 +177,6 @@ async def test_fetch_thread_not_found_fetch(mock_log, mock_client, mock_event_op
     mock_client.fetch_channel.assert_awaited_once()
 
 
-@patch("offkai_bot.event_actions._log")
 async def test_fetch_thread_forbidden_fetch(mock_log, mock_client, mock_event_open):
     """Test fetch_thread_for_event raises ThreadAccessError on fetch_channel Forbidden."""
     mock_client.get_channel.return_value = None
@@ -144,7 +193,6 @@ async def test_fetch_thread_forbidden_fetch(mock_log, mock_client, mock_event_op
     mock_client.fetch_channel.assert_awaited_once()
 
 
-@patch("offkai_bot.event_actions._log")
 async def test_fetch_thread_wrong_type(mock_log, mock_client, mock_event_open):
     """Test fetch_thread_for_event raises ThreadNotFoundError for wrong channel type."""
     wrong_channel = MagicMock(spec=discord.TextChannel)  # Not a Thread
@@ -162,7 +210,6 @@ async def test_fetch_thread_wrong_type(mock_log, mock_client, mock_event_open):
 # --- Tests for _fetch_event_message ---
 
 
-@patch("offkai_bot.event_actions._log")
 async def test_fetch_message_success(mock_log, mock_thread, mock_message, mock_event_open):
     """Test _fetch_event_message success."""
     mock_event_open.message_id = mock_message.id
@@ -177,7 +224,6 @@ async def test_fetch_message_success(mock_log, mock_thread, mock_message, mock_e
     mock_log.error.assert_not_called()
 
 
-@patch("offkai_bot.event_actions._log")
 async def test_fetch_message_no_id(mock_log, mock_thread, mock_event_no_ids):
     """Test _fetch_event_message when event has no message_id."""
     message = await event_actions._fetch_event_message(mock_thread, mock_event_no_ids)
@@ -185,7 +231,6 @@ async def test_fetch_message_no_id(mock_log, mock_thread, mock_event_no_ids):
     mock_thread.fetch_message.assert_not_awaited()
 
 
-@patch("offkai_bot.event_actions._log")
 async def test_fetch_message_not_found(mock_log, mock_thread, mock_event_open):
     """Test _fetch_event_message when fetch_message raises NotFound."""
     original_id = 12345
@@ -203,7 +248,6 @@ async def test_fetch_message_not_found(mock_log, mock_thread, mock_event_open):
     assert args[1] == original_id
 
 
-@patch("offkai_bot.event_actions._log")
 async def test_fetch_message_forbidden(mock_log, mock_thread, mock_event_open):
     """Test _fetch_event_message when fetch_message raises Forbidden."""
     original_id = 12345
@@ -219,7 +263,6 @@ async def test_fetch_message_forbidden(mock_log, mock_thread, mock_event_open):
     assert "Bot lacks permissions to fetch message" in mock_log.error.call_args[0][0]
 
 
-@patch("offkai_bot.event_actions._log")
 async def test_fetch_message_http_error(mock_log, mock_thread, mock_event_open):
     """Test _fetch_event_message when fetch_message raises HTTPException."""
     original_id = 12345
@@ -238,324 +281,227 @@ async def test_fetch_message_http_error(mock_log, mock_thread, mock_event_open):
 # --- Tests for send_event_message ---
 
 
-@patch("offkai_bot.event_actions.save_event_data")
-@patch("offkai_bot.event_actions.create_event_message")
-@patch("offkai_bot.event_actions._log")
-async def test_send_message_success_open(
-    mock_log, mock_create_msg, mock_save, mock_thread, mock_message, mock_event_open
-):
+async def test_send_message_success_open(send_mocks, mock_thread, mock_message, mock_event_open):
     """Test send_event_message success for an open event."""
     mock_content = "Test Message Content Open"
-    mock_create_msg.return_value = mock_content
+    send_mocks.create_event_message.return_value = mock_content
     mock_thread.send.return_value = mock_message  # Mock send returning the message
 
     await event_actions.send_event_message(mock_thread, mock_event_open)
 
-    mock_create_msg.assert_called_once_with(mock_event_open)
+    send_mocks.create_event_message.assert_called_once_with(mock_event_open)
     # Check view type passed to send
     call_args, call_kwargs = mock_thread.send.call_args
     assert call_args[0] == mock_content
     assert isinstance(call_kwargs["view"], event_actions.OpenEvent)
     # Check message ID was set and saved
     assert mock_event_open.message_id == mock_message.id
-    mock_save.assert_called_once()
-    mock_log.info.assert_called_once()
+    send_mocks.save_event_data.assert_called_once()
+    send_mocks._log.info.assert_called_once()
 
 
-@patch("offkai_bot.event_actions.save_event_data")
-@patch("offkai_bot.event_actions.create_event_message")
-@patch("offkai_bot.event_actions._log")
-async def test_send_message_success_closed(
-    mock_log, mock_create_msg, mock_save, mock_thread, mock_message, mock_event_closed
-):
+async def test_send_message_success_closed(send_mocks, mock_thread, mock_message, mock_event_closed):
     """Test send_event_message success for a closed event."""
     mock_content = "Test Message Content Closed"
-    mock_create_msg.return_value = mock_content
+    send_mocks.create_event_message.return_value = mock_content
     mock_thread.send.return_value = mock_message
 
     await event_actions.send_event_message(mock_thread, mock_event_closed)
 
-    mock_create_msg.assert_called_once_with(mock_event_closed)
+    send_mocks.create_event_message.assert_called_once_with(mock_event_closed)
     # Check view type passed to send
     call_args, call_kwargs = mock_thread.send.call_args
     assert call_args[0] == mock_content
     assert isinstance(call_kwargs["view"], interactions.ClosedEvent)
     # Check message ID was set and saved
     assert mock_event_closed.message_id == mock_message.id
-    mock_save.assert_called_once()
-    mock_log.info.assert_called_once()
+    send_mocks.save_event_data.assert_called_once()
+    send_mocks._log.info.assert_called_once()
 
 
-@patch("offkai_bot.event_actions.save_event_data")
-@patch("offkai_bot.event_actions.create_event_message")
-@patch("offkai_bot.event_actions._log")
-async def test_send_message_http_error(mock_log, mock_create_msg, mock_save, mock_thread, mock_event_open):
+async def test_send_message_http_error(send_mocks, mock_thread, mock_event_open):
     """Test send_event_message handles HTTPException during send."""
-    mock_create_msg.return_value = "Content"
+    send_mocks.create_event_message.return_value = "Content"
     mock_thread.send.side_effect = discord.HTTPException(MagicMock(), "Send failed")
 
     await event_actions.send_event_message(mock_thread, mock_event_open)
 
     mock_thread.send.assert_awaited_once()
-    mock_save.assert_not_called()  # Save should not happen on error
-    mock_log.error.assert_called_once()
+    send_mocks.save_event_data.assert_not_called()  # Save should not happen on error
+    send_mocks._log.error.assert_called_once()
     # CORRECTED ASSERTION
-    assert "Failed to send or pin event message" in mock_log.error.call_args[0][0]
+    assert "Failed to send or pin event message" in send_mocks._log.error.call_args[0][0]
 
 
 # --- Tests for update_event_message ---
 
 
-@patch("offkai_bot.event_actions.send_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions._fetch_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.fetch_thread_for_event", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.create_event_message")
-@patch("offkai_bot.event_actions._log")
-async def test_update_message_success_edit(
-    mock_log,
-    mock_create_msg,
-    mock_fetch_thread,
-    mock_fetch_msg,
-    mock_send_new,
-    mock_client,
-    mock_thread,
-    mock_message,
-    mock_event_open,
-):
+async def test_update_message_success_edit(update_mocks, mock_client, mock_thread, mock_message, mock_event_open):
     """Test update_event_message successfully edits an existing message."""
-    mock_fetch_thread.return_value = mock_thread
-    mock_fetch_msg.return_value = mock_message
+    update_mocks.fetch_thread_for_event.return_value = mock_thread
+    update_mocks._fetch_event_message.return_value = mock_message
     mock_content = "Updated Content"
-    mock_create_msg.return_value = mock_content
+    update_mocks.create_event_message.return_value = mock_content
 
     await event_actions.update_event_message(mock_client, mock_event_open)
 
-    mock_fetch_thread.assert_awaited_once_with(mock_client, mock_event_open)
-    mock_fetch_msg.assert_awaited_once_with(mock_thread, mock_event_open)
-    mock_create_msg.assert_called_once_with(mock_event_open)
+    update_mocks.fetch_thread_for_event.assert_awaited_once_with(mock_client, mock_event_open)
+    update_mocks._fetch_event_message.assert_awaited_once_with(mock_thread, mock_event_open)
+    update_mocks.create_event_message.assert_called_once_with(mock_event_open)
     # Check edit was called with correct content and view
     call_args, call_kwargs = mock_message.edit.call_args
     assert call_kwargs["content"] == mock_content
     assert isinstance(call_kwargs["view"], interactions.OpenEvent)
     mock_message.edit.assert_awaited_once()
     # Check send_new was NOT called
-    mock_send_new.assert_not_awaited()
-    mock_log.info.assert_called_once()  # Log update success
-
-
-@patch("offkai_bot.event_actions.send_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions._fetch_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.fetch_thread_for_event", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.create_event_message")
-@patch("offkai_bot.event_actions._log")
-async def test_update_message_success_send_new(
-    mock_log,
-    mock_create_msg,
-    mock_fetch_thread,
-    mock_fetch_msg,
-    mock_send_new,
-    mock_client,
-    mock_thread,
-    mock_message,  # mock_message isn't strictly needed here now
-    mock_event_open,  # Use the base open event fixture
-):
+    update_mocks.send_event_message.assert_not_awaited()
+    update_mocks._log.info.assert_called_once()  # Log update success
+
+
+async def test_update_message_success_send_new(update_mocks, mock_client, mock_thread, mock_message, mock_event_open):
     """Test update_event_message sends a new message if event.message_id is None."""
     # Arrange
     # --- MODIFICATION: Ensure message_id is None for this test case ---
     mock_event_open.message_id = None
     # --- END MODIFICATION ---
 
-    mock_fetch_thread.return_value = mock_thread
+    update_mocks.fetch_thread_for_event.return_value = mock_thread
     # _fetch_event_message won't actually be called if message_id is None,
     # but setting return value doesn't hurt.
-    mock_fetch_msg.return_value = None
+    update_mocks._fetch_event_message.return_value = None
     # create_event_message is still needed by send_event_message
-    mock_create_msg.return_value = "Content For New"
+    update_mocks.create_event_message.return_value = "Content For New"
 
     # Act
     await event_actions.update_event_message(mock_client, mock_event_open)
 
     # Assert
-    mock_fetch_thread.assert_awaited_once_with(mock_client, mock_event_open)
+    update_mocks.fetch_thread_for_event.assert_awaited_once_with(mock_client, mock_event_open)
     # _fetch_event_message should be called anyway
-    mock_fetch_msg.assert_awaited_once()
+    update_mocks._fetch_event_message.assert_awaited_once()
     # Check edit was NOT called (mock_message fixture isn't used, but the mock exists)
     mock_message.edit.assert_not_awaited()
     # Check send_new WAS called
-    mock_send_new.assert_awaited_once_with(mock_thread, mock_event_open)
-    mock_log.info.assert_called()  # Log sending new
+    update_mocks.send_event_message.assert_awaited_once_with(mock_thread, mock_event_open)
+    update_mocks._log.info.assert_called()  # Log sending new
 
 
-@patch("offkai_bot.event_actions.send_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions._fetch_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.fetch_thread_for_event", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions._log")
-async def test_update_message_thread_fetch_fails(
-    mock_log, mock_fetch_thread, mock_fetch_msg, mock_send_new, mock_client, mock_event_open
-):
+async def test_update_message_thread_fetch_fails(update_mocks, mock_client, mock_event_open):
     """Test update_event_message returns early if thread fetch fails."""
     error_to_raise = ThreadNotFoundError(mock_event_open.event_name, mock_event_open.channel_id)
-    mock_fetch_thread.side_effect = error_to_raise
+    update_mocks.fetch_thread_for_event.side_effect = error_to_raise
 
     await event_actions.update_event_message(mock_client, mock_event_open)
 
-    mock_fetch_thread.assert_awaited_once_with(mock_client, mock_event_open)
+    update_mocks.fetch_thread_for_event.assert_awaited_once_with(mock_client, mock_event_open)
     # Check subsequent steps were skipped
-    mock_fetch_msg.assert_not_awaited()
-    mock_send_new.assert_not_awaited()
+    update_mocks._fetch_event_message.assert_not_awaited()
+    update_mocks.send_event_message.assert_not_awaited()
     # Check error was logged
-    mock_log.log.assert_called_once()
-    assert mock_log.log.call_args[0][0] == logging.WARNING  # Check level
-    assert "Failed to get thread for event '%s'" in mock_log.log.call_args[0][1]
+    update_mocks._log.log.assert_called_once()
+    assert update_mocks._log.log.call_args[0][0] == logging.WARNING  # Check level
+    assert "Failed to get thread for event '%s'" in update_mocks._log.log.call_args[0][1]
 
 
-@patch("offkai_bot.event_actions.send_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions._fetch_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.fetch_thread_for_event", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions._log")
-async def test_update_message_message_fetch_fails_perms(
-    mock_log, mock_fetch_thread, mock_fetch_msg, mock_send_new, mock_client, mock_thread, mock_event_open
-):
+async def test_update_message_message_fetch_fails_perms(update_mocks, mock_client, mock_thread, mock_event_open):
     """Test update_event_message returns early if message fetch fails (perms/HTTP)."""
-    mock_fetch_thread.return_value = mock_thread
+    update_mocks.fetch_thread_for_event.return_value = mock_thread
     # Simulate fetch failing but returning None (error logged internally by helper)
-    mock_fetch_msg.return_value = None
+    update_mocks._fetch_event_message.return_value = None
     # Crucially, ensure the event *had* a message ID initially, so we know fetch failed, not just missing ID
     mock_event_open.message_id = 99999
 
     await event_actions.update_event_message(mock_client, mock_event_open)
 
-    mock_fetch_thread.assert_awaited_once_with(mock_client, mock_event_open)
-    mock_fetch_msg.assert_awaited_once_with(mock_thread, mock_event_open)
+    update_mocks.fetch_thread_for_event.assert_awaited_once_with(mock_client, mock_event_open)
+    update_mocks._fetch_event_message.assert_awaited_once_with(mock_thread, mock_event_open)
     # Check subsequent steps were skipped
-    mock_send_new.assert_not_awaited()
+    update_mocks.send_event_message.assert_not_awaited()
     # Error logging is handled inside _fetch_event_message, check log wasn't called again here
-    mock_log.log.assert_not_called()  # update_event_message itself shouldn't log again
-
-
-@patch("offkai_bot.event_actions.send_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions._fetch_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.fetch_thread_for_event", new_callable=AsyncMock)
-@patch("offkai_bot.event_actions.create_event_message")
-@patch("offkai_bot.event_actions._log")
-async def test_update_message_edit_fails(
-    mock_log,
-    mock_create_msg,
-    mock_fetch_thread,
-    mock_fetch_msg,
-    mock_send_new,
-    mock_client,
-    mock_thread,
-    mock_message,
-    mock_event_open,
-):
+    update_mocks._log.log.assert_not_called()  # update_event_message itself shouldn't log again
+
+
+async def test_update_message_edit_fails(update_mocks, mock_client, mock_thread, mock_message, mock_event_open):
     """Test update_event_message handles errors during message.edit."""
-    mock_fetch_thread.return_value = mock_thread
-    mock_fetch_msg.return_value = mock_message
-    mock_create_msg.return_value = "Content"
+    update_mocks.fetch_thread_for_event.return_value = mock_thread
+    update_mocks._fetch_event_message.return_value = mock_message
+    update_mocks.create_event_message.return_value = "Content"
     mock_message.edit.side_effect = discord.HTTPException(MagicMock(), "Edit failed")
 
     await event_actions.update_event_message(mock_client, mock_event_open)
 
-    mock_fetch_thread.assert_awaited_once()
-    mock_fetch_msg.assert_awaited_once()
+    update_mocks.fetch_thread_for_event.assert_awaited_once()
+    update_mocks._fetch_event_message.assert_awaited_once()
     mock_message.edit.assert_awaited_once()  # Edit was attempted
-    mock_send_new.assert_not_awaited()  # Send new should not be called
-    mock_log.error.assert_called_once()  # Error during edit should be logged
-    assert "Failed to update event message %s" in mock_log.error.call_args[0][0]
+    update_mocks.send_event_message.assert_not_awaited()  # Send new should not be called
+    update_mocks._log.error.assert_called_once()  # Error during edit should be logged
+    assert "Failed to update event message %s" in update_mocks._log.error.call_args[0][0]
 
 
 # --- Tests for load_and_update_events ---
 
 
-@patch("offkai_bot.main.register_deadline_reminders")  # Outermost patch, last mock arg
-@patch("offkai_bot.main.fetch_thread_for_event", new_callable=AsyncMock)  # Fourth patch
-@patch("offkai_bot.main.update_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.main.load_event_data")
-@patch("offkai_bot.main._log")
 async def test_load_and_update_events_success(
-    mock_ea_log,  # Corresponds to event_actions._log
-    mock_load_data,
-    mock_update_event_message,
-    mock_fetch_thread,
-    mock_register_reminders,
-    # Pytest fixtures
-    mock_client,
-    mock_event_open,
-    mock_event_closed,
-    mock_event_archived,
-    mock_thread,  # Assumed to be an available fixture providing a mock discord.Thread
+    main_mocks, mock_client, mock_event_open, mock_event_closed, mock_event_archived, mock_thread
 ):
     """Test load_and_update_events calls update for non-archived events."""
     mock_events = [mock_event_open, mock_event_closed, mock_event_archived]
-    mock_load_data.return_value = mock_events
+    main_mocks.load_event_data.return_value = mock_events
 
-    mock_fetch_thread.return_value = mock_thread
+    main_mocks.fetch_thread_for_event.return_value = mock_thread
 
     await load_and_update_events(mock_client)
 
-    mock_load_data.assert_called_once()
+    main_mocks.load_event_data.assert_called_once()
     # Check update was called for open and closed, but not archived
-    assert mock_update_event_message.await_count == 2
-    mock_update_event_message.assert_any_await(mock_client, mock_event_open)
-    mock_update_event_message.assert_any_await(mock_client, mock_event_closed)
+    assert main_mocks.update_event_message.await_count == 2
+    main_mocks.update_event_message.assert_any_await(mock_client, mock_event_open)
+    main_mocks.update_event_message.assert_any_await(mock_client, mock_event_closed)
 
     # Check register_deadline_reminders calls
-    assert mock_register_reminders.call_count == 2  # Called for open and closed events
-    mock_register_reminders.assert_any_call(mock_client, mock_event_open, mock_thread)
-    mock_register_reminders.assert_any_call(mock_client, mock_event_closed, mock_thread)
+    assert main_mocks.register_deadline_reminders.call_count == 2  # Called for open and closed events
+    main_mocks.register_deadline_reminders.assert_any_call(mock_client, mock_event_open, mock_thread)
+    main_mocks.register_deadline_reminders.assert_any_call(mock_client, mock_event_closed, mock_thread)
+
+    # Check-in reminders are registered for the same two events
+    assert main_mocks.register_checkin_reminder.call_count == 2
+    main_mocks.register_checkin_reminder.assert_any_call(mock_client, mock_event_open)
+    main_mocks.register_checkin_reminder.assert_any_call(mock_client, mock_event_closed)
 
     # Check it wasn't called with the archived one (difficult to assert directly not called with specific args)
     # Instead, rely on the await_count being correct (2 calls, not 3)
-    mock_ea_log.info.assert_called()  # Check startup/finish logs
+    main_mocks._log.info.assert_called()  # Check startup/finish logs
 
 
-@patch("offkai_bot.main.update_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.main.load_event_data")
-@patch("offkai_bot.main._log")
-async def test_load_and_update_events_no_events(mock_log, mock_load_data, mock_update, mock_client):
+async def test_load_and_update_events_no_events(main_mocks, mock_client):
     """Test load_and_update_events when no events are loaded."""
-    mock_load_data.return_value = []
+    main_mocks.load_event_data.return_value = []
 
     await load_and_update_events(mock_client)
 
-    mock_load_data.assert_called_once()
-    mock_update.assert_not_awaited()  # Update should not be called
-    mock_log.info.assert_any_call("No events found to load.")
+    main_mocks.load_event_data.assert_called_once()
+    main_mocks.update_event_message.assert_not_awaited()  # Update should not be called
+    main_mocks._log.info.assert_any_call("No events found to load.")
 
 
-@patch("offkai_bot.main.register_checkin_reminder")
-@patch("offkai_bot.main.register_deadline_reminders")
-@patch("offkai_bot.main.fetch_thread_for_event", new_callable=AsyncMock)
-@patch("offkai_bot.main.update_event_message", new_callable=AsyncMock)
-@patch("offkai_bot.main.load_event_data")
-@patch("offkai_bot.main._log")
 async def test_load_and_update_events_continues_after_fetch_thread_error(
-    mock_log,
-    mock_load_data,
-    mock_update_event_message,
-    mock_fetch_thread,
-    mock_register_deadline_reminders,
-    mock_register_checkin_reminder,
-    mock_client,
-    mock_event_open,
-    mock_event_closed,
+    main_mocks, mock_client, mock_event_open, mock_event_closed
 ):
     """A fetch_thread_for_event failure for one event must not abort the loop for remaining events."""
     mock_events = [mock_event_open, mock_event_closed]
-    mock_load_data.return_value = mock_events
+    main_mocks.load_event_data.return_value = mock_events
 
     recovered_thread = MagicMock()
-    mock_fetch_thread.side_effect = [Exception("Discord API error"), recovered_thread]
+    main_mocks.fetch_thread_for_event.side_effect = [Exception("Discord API error"), recovered_thread]
 
     await load_and_update_events(mock_client)
 
     # Both events still had update_event_message and register_checkin_reminder attempted
-    assert mock_update_event_message.await_count == 2
-    assert mock_register_checkin_reminder.call_count == 2
+    assert main_mocks.update_event_message.await_count == 2
+    assert main_mocks.register_checkin_reminder.call_count == 2
 
     # Deadline reminders only registered for the second event (first raised before reaching it)
-    mock_register_deadline_reminders.assert_called_once_with(mock_client, mock_event_closed, recovered_thread)
+    main_mocks.register_deadline_reminders.assert_called_once_with(mock_client, mock_event_closed, recovered_thread)
 
     # The exception was logged
-    mock_log.exception.assert_called_once()
+    main_mocks._log.exception.assert_called_once()
@@ -3,6 +3,7 @@
 from datetime import UTC, datetime
 
 import pytest
+from offkai_bot.data import response as response_data
 from offkai_bot.data.response import (
     Response,
     WaitlistEntry,
@@ -15,6 +16,43 @@ from offkai_bot.data.response import (
 )
 from offkai_bot.errors import DuplicateResponseError
 
+SIGNUP_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _make_response(user_id, username, event_name, extra_people=0):
+    """Builds a confirmed Response with no drinks."""
+    return Response(
+        user_id=user_id,
+        username=username,
+        extra_people=extra_people,
+        behavior_confirmed=True,
+        arrival_confirmed=True,
+        event_name=event_name,
+        timestamp=SIGNUP_TIME,
+        drinks=[],
+    )
+
+
+def _make_waitlist_entry(user_id, username, event_name, extra_people=0):
+    """Builds a confirmed WaitlistEntry with no drinks."""
+    return WaitlistEntry(
+        user_id=user_id,
+        username=username,
+        extra_people=extra_people,
+        behavior_confirmed=True,
+        arrival_confirmed=True,
+        event_name=event_name,
+        timestamp=SIGNUP_TIME,
+        drinks=[],
+    )
+
+
+@pytest.fixture(autouse=True)
+def empty_response_cache(monkeypatch):
+    """Starts each test from an empty in-memory response cache that is never written to disk."""
+    monkeypatch.setattr(response_data, "RESPONSE_DATA_CACHE", {})
+    monkeypatch.setattr(response_data, "save_responses", lambda: None)
+
 
 def test_event_isolation_across_multiple_events():
     """
@@ -24,37 +62,12 @@ def test_event_isolation_across_multiple_events():
     1. Create test1, user A joins, user B joins waitlist, user A withdraws, user B promoted
     2. Verify test2 is completely independent - no users registered
     """
-    now = datetime.now(UTC)
-
-    # Initialize cache
-    from offkai_bot.data.response import load_responses
-
-    load_responses()  # Loads both attendees and waitlist
-
     # User A joins test1 with +1 (2 people)
-    response_a_test1 = Response(
-        user_id=111,  # User A
-        username="UserA",
-        extra_people=1,
-        behavior_confirmed=True,
-        arrival_confirmed=True,
-        event_name="test1",
-        timestamp=now,
-        drinks=[],
-    )
+    response_a_test1 = _make_response(111, "UserA", "test1", extra_people=1)
     add_response("test1", response_a_test1)
 
     # User B tries to join test1 with +1 (would be 4 total, goes to waitlist)
-    waitlist_b_test1 = WaitlistEntry(
-        user_id=222,  # User B
-        username="UserB",
-        extra_people=1,
-        behavior_confirmed=True,
-        arrival_confirmed=True,
-        event_name="test1",
-        timestamp=now,
-        drinks=[],
-    )
+    waitlist_b_test1 = _make_waitlist_entry(222, "UserB", "test1", extra_people=1)
     add_to_waitlist("test1", waitlist_b_test1)
 
     # User A withdraws from test1
@@ -94,70 +107,26 @@ def test_event_isolation_across_multiple_events():
 
     # Verify users can register for test2 without being prevented
     # (DuplicateResponseError would only trigger if they try to register twice for the SAME event)
-    response_a_test2 = Response(
-        user_id=111,
-        username="UserA",
-        extra_people=0,
-        behavior_confirmed=True,
-        arrival_confirmed=True,
-        event_name="test2",
-        timestamp=now,
-        drinks=[],
-    )
+    response_a_test2 = _make_response(111, "UserA", "test2")
     add_response("test2", response_a_test2)  # Should succeed without error
 
-    response_b_test2 = Response(
-        user_id=222,
-        username="UserB",
-        extra_people=0,
-        behavior_confirmed=True,
-        arrival_confirmed=True,
-        event_name="test2",
-        timestamp=now,
-        drinks=[],
-    )
+    response_b_test2 = _make_response(222, "UserB", "test2")
     add_response("test2", response_b_test2)  # Should succeed without error
 
     # Verify both users are now in test2
     test2_responses = get_responses("test2")
     assert len(test2_responses) == 2
-    assert any(r.user_id == 111 for r in test2_responses)
-    assert any(r.user_id == 222 for r in test2_responses)
+    assert {r.user_id for r in test2_responses} == {111, 222}
 
 
 def test_cannot_add_to_waitlist_if_in_responses():
     """Test that a user in responses cannot be added to waitlist."""
-    now = datetime.now(UTC)
-
-    # Initialize cache
-    from offkai_bot.data.response import load_responses
-
-    load_responses()  # Loads both attendees and waitlist
-
     # User joins responses
-    response = Response(
-        user_id=111,
-        username="TestUser",
-        extra_people=1,
-        behavior_confirmed=True,
-        arrival_confirmed=True,
-        event_name="test_event",
-        timestamp=now,
-        drinks=[],
-    )
+    response = _make_response(111, "TestUser", "test_event", extra_people=1)
     add_response("test_event", response)
 
     # Try to add same user to waitlist - should fail
-    waitlist_entry = WaitlistEntry(
-        user_id=111,
-        username="TestUser",
-        extra_people=0,
-        behavior_confirmed=True,
-        arrival_confirmed=True,
-        event_name="test_event",
-        timestamp=now,
-        drinks=[],
-    )
+    waitlist_entry = _make_waitlist_entry(111, "TestUser", "test_event")
 
     with pytest.raises(DuplicateResponseError) as exc_info:
         add_to_waitlist("test_event", waitlist_entry)
@@ -173,37 +142,12 @@ def test_cannot_add_to_waitlist_if_in_responses():
 
 def test_cannot_add_to_responses_if_in_waitlist():
     """Test that a user in waitlist cannot be added to responses."""
-    now = datetime.now(UTC)
-
-    # Initialize cache
-    from offkai_bot.data.response import load_responses
-
-    load_responses()  # Loads both attendees and waitlist
-
     # User joins waitlist
-    waitlist_entry = WaitlistEntry(
-        user_id=222,
-        username="TestUser2",
-        extra_people=1,
-        behavior_confirmed=True,
-        arrival_confirmed=True,
-        event_name="test_event2",
-        timestamp=now,
-        drinks=[],
-    )
+    waitlist_entry = _make_waitlist_entry(222, "TestUser2", "test_event2", extra_people=1)
     add_to_waitlist("test_event2", waitlist_entry)
 
     # Try to add same user to responses - should fail
-    response = Response(
-        user_id=222,
-        username="TestUser2",
-        extra_people=0,
-        behavior_confirmed=True,
-        arrival_confirmed=True,
-        event_name="test_event2",
-        timestamp=now,
-        drinks=[],
-    )
+    response = _make_response(222, "TestUser2", "test_event2")
 
     with pytest.raises(DuplicateResponseError) as exc_info:
         add_response("test_event2", response)
@@ -219,24 +163,8 @@ def test_cannot_add_to_responses_if_in_waitlist():
 
 def test_promotion_removes_from_waitlist_before_adding_to_responses():
     """Test that promotion properly removes user from waitlist before adding to responses."""
-    now = datetime.now(UTC)
-
-    # Initialize cache
-    from offkai_bot.data.response import load_responses
-
-    load_responses()  # Loads both attendees and waitlist
-
     # User joins waitlist
-    waitlist_entry = WaitlistEntry(
-        user_id=333,
-        username="TestUser3",
-        extra_people=1,
-        behavior_confirmed=True,
-        arrival_confirmed=True,
-        event_name="test_event3",
-        timestamp=now,
-        drinks=[],
-    )
+    waitlist_entry = _make_waitlist_entry(333, "TestUser3", "test_event3", extra_people=1)
     add_to_waitlist("test_event3", waitlist_entry)
 
     # Promote user
@@ -70,81 +70,77 @@ async def test_create_event_role_success():
     assert call_kwargs["reason"] == "Offkai participant role for 'liella-7l-meetups'"
 
 
-# --- Tests for assign_event_role ---
+# --- Fixtures for assign/remove_event_role ---
+
+
+@pytest.fixture
+def mock_role():
+    """Role the guild resolves for the event."""
+    return MagicMock(spec=discord.Role)
 
 
-async def test_assign_event_role_success():
+@pytest.fixture
+def mock_member():
+    """Cached member holding no roles, with awaitable add_roles/remove_roles."""
+    member = MagicMock(spec=discord.Member)
+    member.roles = []
+    member.add_roles = AsyncMock()
+    member.remove_roles = AsyncMock()
+    return member
+
+
+@pytest.fixture
+def role_guild(mock_role, mock_member):
+    """Guild that resolves the role and has mock_member cached."""
     guild = MagicMock(spec=discord.Guild)
-    mock_role = MagicMock(spec=discord.Role)
+    guild.id = 1
     guild.get_role.return_value = mock_role
-
-    mock_member = MagicMock(spec=discord.Member)
-    mock_member.roles = []
-    mock_member.add_roles = AsyncMock()
     guild.get_member.return_value = mock_member
+    return guild
 
-    await assign_event_role(guild, 12345, 99999)
 
-    guild.get_role.assert_called_once_with(99999)
-    guild.get_member.assert_called_once_with(12345)
-    mock_member.add_roles.assert_awaited_once_with(mock_role, reason="Offkai attendance confirmed")
+# --- Tests for assign_event_role ---
 
 
-async def test_assign_event_role_already_has_role():
-    guild = MagicMock(spec=discord.Guild)
-    mock_role = MagicMock(spec=discord.Role)
-    guild.get_role.return_value = mock_role
+async def test_assign_event_role_success(role_guild, mock_role, mock_member):
+    await assign_event_role(role_guild, 12345, 99999)
+
+    role_guild.get_role.assert_called_once_with(99999)
+    role_guild.get_member.assert_called_once_with(12345)
+    mock_member.add_roles.assert_awaited_once_with(mock_role, reason="Offkai attendance confirmed")
 
-    mock_member = MagicMock(spec=discord.Member)
+
+async def test_assign_event_role_already_has_role(role_guild, mock_role, mock_member):
     mock_member.roles = [mock_role]
-    mock_member.add_roles = AsyncMock()
-    guild.get_member.return_value = mock_member
 
-    await assign_event_role(guild, 12345, 99999)
+    await assign_event_role(role_guild, 12345, 99999)
 
     mock_member.add_roles.assert_not_awaited()
 
 
-async def test_assign_event_role_role_not_found():
-    guild = MagicMock(spec=discord.Guild)
-    guild.get_role.return_value = None
-    guild.id = 1
-
-    await assign_event_role(guild, 12345, 99999)
+async def test_assign_event_role_role_not_found(role_guild):
+    role_guild.get_role.return_value = None
 
-    guild.get_member.assert_not_called()
+    await assign_event_role(role_guild, 12345, 99999)
 
+    role_guild.get_member.assert_not_called()
 
-async def test_assign_event_role_fetches_member_if_not_cached():
-    guild = MagicMock(spec=discord.Guild)
-    mock_role = MagicMock(spec=discord.Role)
-    guild.get_role.return_value = mock_role
-    guild.get_member.return_value = None
 
-    mock_member = MagicMock(spec=discord.Member)
-    mock_member.roles = []
-    mock_member.add_roles = AsyncMock()
-    guild.fetch_member = AsyncMock(return_value=mock_member)
+async def test_assign_event_role_fetches_member_if_not_cached(role_guild, mock_member):
+    role_guild.get_member.return_value = None
+    role_guild.fetch_member = AsyncMock(return_value=mock_member)
 
-    await assign_event_role(guild, 12345, 99999)
+    await assign_event_role(role_guild, 12345, 99999)
 
-    guild.fetch_member.assert_awaited_once_with(12345)
+    role_guild.fetch_member.assert_awaited_once_with(12345)
     mock_member.add_roles.assert_awaited_once()
 
 
 @patch("offkai_bot.role_management._log")
-async def test_assign_event_role_handles_forbidden(mock_log):
-    guild = MagicMock(spec=discord.Guild)
-    mock_role = MagicMock(spec=discord.Role)
-    guild.get_role.return_value = mock_role
-    guild.id = 1
+async def test_assign_event_role_handles_forbidden(mock_log, role_guild, mock_member):
+    mock_member.add_roles.side_effect = discord.Forbidden(MagicMock(), "No perms")
 
-    mock_member = MagicMock(spec=discord.Member)
-    mock_member.roles = []
-    mock_member.add_roles = AsyncMock(side_effect=discord.Forbidden(MagicMock(), "No perms"))
-    guild.get_member.return_value = mock_member
-
-    await assign_event_role(guild, 12345, 99999)
+    await assign_event_role(role_guild, 12345, 99999)
 
     mock_log.warning.assert_called_once()
 
@@ -152,59 +148,34 @@ async def test_assign_event_role_handles_forbidden(mock_log):
 # --- Tests for remove_event_role ---
 
 
-async def test_remove_event_role_success():
-    guild = MagicMock(spec=discord.Guild)
-    mock_role = MagicMock(spec=discord.Role)
-    guild.get_role.return_value = mock_role
-
-    mock_member = MagicMock(spec=discord.Member)
+async def test_remove_event_role_success(role_guild, mock_role, mock_member):
     mock_member.roles = [mock_role]
-    mock_member.remove_roles = AsyncMock()
-    guild.get_member.return_value = mock_member
 
-    await remove_event_role(guild, 12345, 99999)
+    await remove_event_role(role_guild, 12345, 99999)
 
-    guild.get_role.assert_called_once_with(99999)
+    role_guild.get_role.assert_called_once_with(99999)
     mock_member.remove_roles.assert_awaited_once_with(mock_role, reason="Offkai attendance withdrawn")
 
 
-async def test_remove_event_role_doesnt_have_role():
-    guild = MagicMock(spec=discord.Guild)
-    mock_role = MagicMock(spec=discord.Role)
-    guild.get_role.return_value = mock_role
-
-    mock_member = MagicMock(spec=discord.Member)
-    mock_member.roles = []
-    mock_member.remove_roles = AsyncMock()
-    guild.get_member.return_value = mock_member
-
-    await remove_event_role(guild, 12345, 99999)
+async def test_remove_event_role_doesnt_have_role(role_guild, mock_member):
+    await remove_event_role(role_guild, 12345, 99999)
 
     mock_member.remove_roles.assert_not_awaited()
 
 
-async def test_remove_event_role_role_not_found():
-    guild = MagicMock(spec=discord.Guild)
-    guild.get_role.return_value = None
-    guild.id = 1
+async def test_remove_event_role_role_not_found(role_guild):
+    role_guild.get_role.return_value = None
 
-    await remove_event_role(guild, 12345, 99999)
+    await remove_event_role(role_guild, 12345, 99999)
 
-    guild.get_member.assert_not_called()
+    role_guild.get_member.assert_not_called()
 
 
 @patch("offkai_bot.role_management._log")
-async def test_remove_event_role_handles_forbidden(mock_log):
-    guild = MagicMock(spec=discord.Guild)
-    mock_role = MagicMock(spec=discord.Role)
-    guild.get_role.return_value = mock_role
-    guild.id = 1
-
-    mock_member = MagicMock(spec=discord.Member)
+async def test_remove_event_role_handles_forbidden(mock_log, role_guild, mock_role, mock_member):
     mock_member.roles = [mock_role]
-    mock_member.remove_roles = AsyncMock(side_effect=discord.Forbidden(MagicMock(), "No perms"))
-    guild.get_member.return_value = mock_member
+    mock_member.remove_roles.side_effect = discord.Forbidden(MagicMock(), "No perms")
 
-    await remove_event_role(guild, 12345, 99999)
+    await remove_event_role(role_guild, 12345, 99999)
 
     mock_log.warning.assert_called_once()
@@ -1,6 +1,7 @@
 # tests/alerts/test_task.py
 
 import logging
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
@@ -20,10 +21,8 @@ pytestmark = pytest.mark.asyncio
 
 @pytest.fixture
 def mock_client():
-    """Fixture for a mock discord.Client."""
-    client = MagicMock(spec=discord.Client)
-    client.get_channel = MagicMock()  # Mock the get_channel method
-    return client
+    """Fixture for a stand-in client; the tasks only use get_channel and guilds."""
+    return SimpleNamespace(get_channel=MagicMock(), guilds=[])
 
 
 @pytest.fixture
@@ -4,7 +4,8 @@ import base64
 import hashlib
 import hmac
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch, sentinel
 
 import discord  # Import discord for type mocking
 import pytest
@@ -32,21 +33,18 @@ from offkai_bot.util import (
 
 # --- Tests for parse_event_datetime ---
 
+# 2024-08-15 19:30 read as JST, i.e. nine hours ahead of UTC
+AUG_15_1930_JST_AS_UTC = datetime(2024, 8, 15, 10, 30, tzinfo=UTC)
+
 
 def test_parse_event_datetime_success():
     """Test parsing a valid datetime string converts assumed JST to UTC."""
     date_str = "2024-08-15 19:30"  # Represents 19:30 JST
 
-    # Calculate expected UTC time
-    expected_naive = datetime(2024, 8, 15, 19, 30)
-    expected_aware_jst = expected_naive.replace(tzinfo=JST)
-    expected_utc = expected_aware_jst.astimezone(UTC)
-    # expected_utc should be datetime(2024, 8, 15, 10, 30, tzinfo=UTC)
-
     # Patch the logger within the function's scope if needed, otherwise assume logging setup works
     with patch("offkai_bot.util._log") as mock_log:
         result = parse_event_datetime(date_str)
-        assert result == expected_utc
+        assert result == AUG_15_1930_JST_AS_UTC
         assert result.tzinfo is UTC  # Explicitly check timezone is UTC
         mock_log.debug.assert_called_once()  # Check logging occurred
 
@@ -55,13 +53,9 @@ def test_parse_event_datetime_textual_date_success():
     """Test parsing a textual date format converts assumed JST to UTC."""
     date_str = "15 Aug 2024 19:30"
 
-    expected_naive = datetime(2024, 8, 15, 19, 30)
-    expected_aware_jst = expected_naive.replace(tzinfo=JST)
-    expected_utc = expected_aware_jst.astimezone(UTC)
-
     with patch("offkai_bot.util._log") as mock_log:
         result = parse_event_datetime(date_str)
-        assert result == expected_utc
+        assert result == AUG_15_1930_JST_AS_UTC
         assert result.tzinfo is UTC
         mock_log.debug.assert_called_once()
 
@@ -102,25 +96,18 @@ def test_parse_event_datetime_relative_date_only_success(mock_dt):
         "invalid date string",  # Completely wrong
         "7pm",  # Rejected by dateparser with the current parser settings
         "",  # Empty string
+        # Valid format but out-of-range values
+        "2024-13-15 19:30",  # Invalid month
+        "2024-08-32 19:30",  # Invalid day
+        "2024-08-15 25:30",  # Invalid hour
     ],
 )
 def test_parse_event_datetime_invalid_format(invalid_str):
-    """Test parsing various invalid datetime string formats."""
+    """Test parsing invalid datetime strings, both malformed and out of range."""
     with pytest.raises(InvalidDateTimeFormatError):
         parse_event_datetime(invalid_str)
 
 
-def test_parse_event_datetime_invalid_values():
-    """Test parsing strings with valid format but invalid date/time values."""
-    # datetime.strptime raises ValueError for these, which our function catches
-    with pytest.raises(InvalidDateTimeFormatError):
-        parse_event_datetime("2024-13-15 19:30")  # Invalid month
-    with pytest.raises(InvalidDateTimeFormatError):
-        parse_event_datetime("2024-08-32 19:30")  # Invalid day
-    with pytest.raises(InvalidDateTimeFormatError):
-        parse_event_datetime("2024-08-15 25:30")  # Invalid hour
-
-
 # --- Tests for parse_drinks ---
 
 
@@ -145,19 +132,30 @@ def test_parse_drinks(input_str, expected_list):
 # --- Tests for validate_interaction_context ---
 
 
+# Built once; validate_interaction_context only reads them. The guild is only
+# truth-tested, while the channels keep class specs for its isinstance check
+GUILD = sentinel.guild
+TEXT_CHANNEL = MagicMock(spec=discord.TextChannel)
+DM_CHANNEL = MagicMock(spec=discord.DMChannel)
+# One mock per rejected channel type, shared by the parametrized cases below
+WRONG_CHANNELS = {
+    discord.DMChannel: DM_CHANNEL,
+    discord.VoiceChannel: MagicMock(spec=discord.VoiceChannel),
+    discord.Thread: MagicMock(spec=discord.Thread),
+    discord.CategoryChannel: MagicMock(spec=discord.CategoryChannel),
+}
+
+
 @pytest.fixture
 def mock_interaction():
-    """Fixture to create a mock discord.Interaction."""
-    interaction = MagicMock(spec=discord.Interaction)
-    interaction.guild = None  # Default to no guild (DM)
-    interaction.channel = None  # Default to no channel
-    return interaction
+    """Fixture for a stand-in interaction; validation only reads guild and channel."""
+    return SimpleNamespace(guild=None, channel=None)  # Default to no guild (DM) and no channel
 
 
 def test_validate_interaction_context_success(mock_interaction):
     """Test validation succeeds in a guild text channel."""
-    mock_interaction.guild = MagicMock(spec=discord.Guild)
-    mock_interaction.channel = MagicMock(spec=discord.TextChannel)
+    mock_interaction.guild = GUILD
+    mock_interaction.channel = TEXT_CHANNEL
     # Should not raise any error
     try:
         validate_interaction_context(mock_interaction)
@@ -168,7 +166,7 @@ def test_validate_interaction_context_success(mock_interaction):
 def test_validate_interaction_context_no_guild(mock_interaction):
     """Test validation fails when interaction.guild is None (DM)."""
     mock_interaction.guild = None
-    mock_interaction.channel = MagicMock(spec=discord.DMChannel)  # Set a channel type for completeness
+    mock_interaction.channel = DM_CHANNEL  # Set a channel type for completeness
     with pytest.raises(InvalidChannelTypeError):
         validate_interaction_context(mock_interaction)
 
@@ -185,122 +183,104 @@ def test_validate_interaction_context_no_guild(mock_interaction):
 )
 def test_validate_interaction_context_wrong_channel_type(mock_interaction, channel_type):
     """Test validation fails with various non-TextChannel types."""
-    mock_interaction.guild = MagicMock(spec=discord.Guild)
-    # Set channel to a mock of the specified type, or None
-    mock_interaction.channel = MagicMock(spec=channel_type) if channel_type else None
+    mock_interaction.guild = GUILD
+    # Set channel to the prebuilt mock of the specified type, or None
+    mock_interaction.channel = WRONG_CHANNELS.get(channel_type)
 
     with pytest.raises(InvalidChannelTypeError):
         validate_interaction_context(mock_interaction)
 
 
+# --- Fixtures for the validate_event_* tests ---
+
+# Fixed "now" shared by the event datetime and deadline validation tests
+NOW_UTC = datetime(2024, 7, 20, 12, 0, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Replaces offkai_bot.util.datetime so that now() returns NOW_UTC."""
+    fake_datetime = MagicMock()
+    fake_datetime.now.return_value = NOW_UTC
+    monkeypatch.setattr("offkai_bot.util.datetime", fake_datetime)
+    return fake_datetime
+
+
 # --- NEW Tests for validate_event_datetime ---
 
 
-# Use patch to control 'now' for reliable testing near the boundary, though less critical here
-@patch("offkai_bot.util.datetime")
-def test_validate_event_datetime_future(mock_dt):
+def test_validate_event_datetime_future(frozen_now):
     """Test validation succeeds when event datetime is in the future."""
-    now_utc = datetime(2024, 7, 20, 12, 0, 0, tzinfo=UTC)
-    mock_dt.now.return_value = now_utc  # Control current time
-
-    future_event_dt = now_utc + timedelta(days=1)
+    future_event_dt = NOW_UTC + timedelta(days=1)
 
     try:
         validate_event_datetime(future_event_dt)
     except EventDateTimeInPastError:
         pytest.fail("validate_event_datetime raised EventDateTimeInPastError unexpectedly")
-    mock_dt.now.assert_called_once_with(UTC)  # Verify UTC was requested
-
-
-@patch("offkai_bot.util.datetime")
-def test_validate_event_datetime_past(mock_dt):
-    """Test validation fails when event datetime is in the past."""
-    now_utc = datetime(2024, 7, 20, 12, 0, 0, tzinfo=UTC)
-    mock_dt.now.return_value = now_utc  # Control current time
+    frozen_now.now.assert_called_once_with(UTC)  # Verify UTC was requested
 
-    past_event_dt = now_utc - timedelta(seconds=1)  # Just slightly in the past
-
-    with pytest.raises(EventDateTimeInPastError):
-        validate_event_datetime(past_event_dt)
-    mock_dt.now.assert_called_once_with(UTC)
-
-
-@patch("offkai_bot.util.datetime")
-def test_validate_event_datetime_exactly_now(mock_dt):
-    """Test validation fails when event datetime is exactly now (considered past)."""
-    now_utc = datetime(2024, 7, 20, 12, 0, 0, tzinfo=UTC)
-    mock_dt.now.return_value = now_utc  # Control current time
-
-    event_dt_now = now_utc  # Exactly the same time
 
+@pytest.mark.parametrize(
+    "offset",
+    [
+        timedelta(seconds=-1),  # Just slightly in the past
+        timedelta(0),  # Exactly now, which is considered past
+    ],
+)
+def test_validate_event_datetime_not_in_future(frozen_now, offset):
+    """Test validation fails when event datetime is not after now."""
     with pytest.raises(EventDateTimeInPastError):
-        validate_event_datetime(event_dt_now)
-    mock_dt.now.assert_called_once_with(UTC)
+        validate_event_datetime(NOW_UTC + offset)
+    frozen_now.now.assert_called_once_with(UTC)
 
 
 # --- NEW Tests for validate_event_deadline ---
 
-# Define some reference points for deadline tests
-NOW_UTC_FOR_DEADLINE = datetime(2024, 7, 20, 12, 0, 0, tzinfo=UTC)
-FUTURE_DEADLINE = NOW_UTC_FOR_DEADLINE + timedelta(days=5)  # July 25th
+# Reference points for deadline tests
+FUTURE_DEADLINE = NOW_UTC + timedelta(days=5)  # July 25th
 FUTURE_EVENT_AFTER_DEADLINE = FUTURE_DEADLINE + timedelta(days=10)  # Aug 4th
-PAST_DEADLINE = NOW_UTC_FOR_DEADLINE - timedelta(days=1)  # July 19th
+PAST_DEADLINE = NOW_UTC - timedelta(days=1)  # July 19th
 EVENT_BEFORE_DEADLINE = FUTURE_DEADLINE - timedelta(days=1)  # July 24th
 
 
-@patch("offkai_bot.util.datetime")
-def test_validate_event_deadline_success(mock_dt):
+def test_validate_event_deadline_success(frozen_now):
     """Test validation succeeds when deadline is future and before event."""
-    mock_dt.now.return_value = NOW_UTC_FOR_DEADLINE
-
     try:
         validate_event_deadline(FUTURE_EVENT_AFTER_DEADLINE, FUTURE_DEADLINE)
     except (EventDeadlineInPastError, EventDeadlineAfterEventError):
         pytest.fail("validate_event_deadline raised an error unexpectedly")
-    mock_dt.now.assert_called_once_with(UTC)
+    frozen_now.now.assert_called_once_with(UTC)
 
 
-@patch("offkai_bot.util.datetime")
-def test_validate_event_deadline_past(mock_dt):
+def test_validate_event_deadline_past(frozen_now):
     """Test validation fails when deadline is in the past."""
-    mock_dt.now.return_value = NOW_UTC_FOR_DEADLINE
-
     with pytest.raises(EventDeadlineInPastError):
         validate_event_deadline(FUTURE_EVENT_AFTER_DEADLINE, PAST_DEADLINE)
-    mock_dt.now.assert_called_once_with(UTC)
+    frozen_now.now.assert_called_once_with(UTC)
 
 
-@patch("offkai_bot.util.datetime")
-def test_validate_event_deadline_after_event(mock_dt):
+def test_validate_event_deadline_after_event(frozen_now):
     """Test validation fails when deadline is after the event time."""
-    mock_dt.now.return_value = NOW_UTC_FOR_DEADLINE
-
     with pytest.raises(EventDeadlineAfterEventError):
         validate_event_deadline(EVENT_BEFORE_DEADLINE, FUTURE_DEADLINE)  # Deadline is after event
-    mock_dt.now.assert_called_once_with(UTC)
+    frozen_now.now.assert_called_once_with(UTC)
 
 
-@patch("offkai_bot.util.datetime")
-def test_validate_event_deadline_equal_to_event(mock_dt):
+def test_validate_event_deadline_equal_to_event(frozen_now):
     """Test validation fails when deadline is exactly the event time."""
-    mock_dt.now.return_value = NOW_UTC_FOR_DEADLINE
-
     with pytest.raises(EventDeadlineAfterEventError):
         validate_event_deadline(FUTURE_DEADLINE, FUTURE_DEADLINE)  # Deadline == Event time
-    mock_dt.now.assert_called_once_with(UTC)
+    frozen_now.now.assert_called_once_with(UTC)
 
 
-@patch("offkai_bot.util.datetime")
-def test_validate_event_deadline_past_error_takes_precedence(mock_dt):
+def test_validate_event_deadline_past_error_takes_precedence(frozen_now):
     """Test that DeadlineInPastError is raised even if deadline is also after event."""
-    mock_dt.now.return_value = NOW_UTC_FOR_DEADLINE
-
     # Deadline is both in the past AND technically after the (even further past) event time
     past_event_time = PAST_DEADLINE - timedelta(days=1)
 
     with pytest.raises(EventDeadlineInPastError):  # Expect the "past" error first
         validate_event_deadline(past_event_time, PAST_DEADLINE)
-    mock_dt.now.assert_called_once_with(UTC)
+    frozen_now.now.assert_called_once_with(UTC)
 
 
 # --- Tests for generate_checkin_signature (legacy, event-less) ---